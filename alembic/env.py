@@ -6,23 +6,27 @@ from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 from app.config.database_settings import database_settings
-from app.core.database import Base
 from app.core.logger import logger
-from app.db import base_models  # noqa: F401
 
 # Alembic Config
 config = context.config
 fileConfig(config.config_file_name)
 
-# Target metadata for autogenerate
-target_metadata = Base.metadata
-
 # Database URL (from .env)
 database_url = database_settings.DATABASE_URL
 
 
+def get_target_metadata():
+    """Import models only when a migration run actually needs the metadata."""
+    from app.core.database import Base
+    from app.db import base_models  # noqa: F401
+
+    return Base.metadata
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
+    target_metadata = get_target_metadata()
     context.configure(
         url=database_url,
         target_metadata=target_metadata,
@@ -35,6 +39,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
+    target_metadata = get_target_metadata()
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
@@ -54,11 +59,11 @@ async def run_migrations_online() -> None:
     await connectable.dispose()
 
 
-logger.info("Running Alembic migrations...")
-
 if context.is_offline_mode():
+    logger.info("Running Alembic migrations (offline)...")
     run_migrations_offline()
 else:
     import asyncio
 
+    logger.info("Running Alembic migrations...")
     asyncio.run(run_migrations_online())
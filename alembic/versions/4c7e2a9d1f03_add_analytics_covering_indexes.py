@@ -0,0 +1,54 @@
+"""Add analytics covering indexes
+
+Revision ID: 4c7e2a9d1f03
+Revises: 1923e751f145
+Create Date: 2026-10-17 10:12:43.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c7e2a9d1f03"
+down_revision: Union[str, None] = "1923e751f145"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_completed_user_quiz",
+            "quiz_attempts",
+            ["completed_at", "user_id", "quiz_id"],
+            unique=False,
+            postgresql_where=sa.text("completed_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_user_answer_attempt_correct",
+            "quiz_user_answers",
+            ["attempt_id"],
+            unique=False,
+            postgresql_include=["is_correct"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_user_answer_attempt_correct",
+            table_name="quiz_user_answers",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_completed_user_quiz",
+            table_name="quiz_attempts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,61 @@
+"""Add listing composite indexes
+
+Revision ID: 7b1d3e5f9a24
+Revises: 4c7e2a9d1f03
+Create Date: 2026-10-17 14:05:21.730146
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1d3e5f9a24"
+down_revision: Union[str, None] = "4c7e2a9d1f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial-index predicate)
+INDEXES = [
+    ("idx_companies_owner_created", "companies", ["owner_id", "created_at"], None),
+    ("idx_companies_visible_created", "companies", ["created_at"], "is_visible"),
+    (
+        "idx_invitations_company_created",
+        "invitations",
+        ["company_id", "created_at"],
+        None,
+    ),
+    ("idx_invitations_user_created", "invitations", ["user_id", "created_at"], None),
+    ("idx_requests_company_created", "requests", ["company_id", "created_at"], None),
+    ("idx_requests_user_created", "requests", ["user_id", "created_at"], None),
+    (
+        "idx_notifications_user_created",
+        "notifications",
+        ["user_id", "created_at", "id"],
+        None,
+    ),
+    ("idx_quizzes_company_created", "quizzes", ["company_id", "created_at"], None),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
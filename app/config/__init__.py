@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any
+
 from app.config.app_settings import AppSettings
 from app.config.auth0_settings import Auth0Settings
 from app.config.auth_settings import AuthSettings
@@ -6,12 +9,39 @@ from app.config.redis_settings import RedisSettings
 
 
 class Settings:
-    def __init__(self):
-        self.app = AppSettings()
-        self.auth0 = Auth0Settings()
-        self.auth = AuthSettings()
-        self.database = DatabaseSettings()
-        self.redis = RedisSettings()
+    _sections = {
+        "app": AppSettings,
+        "auth0": Auth0Settings,
+        "auth": AuthSettings,
+        "database": DatabaseSettings,
+        "redis": RedisSettings,
+    }
+
+    def __init__(self, **sections):
+        for name, config_cls in self._sections.items():
+            setattr(self, name, sections.get(name) or config_cls.from_env())
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, dict[str, Any]]) -> "Settings":
+        """
+        Build Settings from already-validated values (e.g. a to_dict() snapshot
+        handed to a worker) without re-reading env or re-running validators.
+        """
+        return cls(
+            **{
+                name: config_cls.from_trusted(data[name])
+                for name, config_cls in cls._sections.items()
+            }
+        )
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {name: getattr(self, name).to_dict() for name in self._sections}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed once)."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from app.config.base import BaseConfig
 
 
@@ -9,8 +11,8 @@ class AppSettings(BaseConfig):
     RELOAD: bool = True
     BACKEND_CORS_ORIGINS: str = ""
 
-    @property
-    def get_cors_origins(self) -> list[str]:
+    @cached_property
+    def get_cors_origins(self) -> tuple[str, ...]:
         if not self.BACKEND_CORS_ORIGINS:
-            return []
-        return [origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",")]
+            return ()
+        return tuple(origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(","))
@@ -1,7 +1,10 @@
-from app.config.base import BaseConfig
+from dataclasses import dataclass
 
+from app.config.base import EnvDataclass
 
-class Auth0Settings(BaseConfig):
+
+@dataclass(frozen=True, slots=True)
+class Auth0Settings(EnvDataclass):
     AUTH0_DOMAIN: str = ""
     AUTH0_CLIENT_ID: str = ""
     AUTH0_CLIENT_SECRET: str = ""
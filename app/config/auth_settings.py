@@ -1,9 +1,15 @@
-from app.config.base import BaseConfig
+from dataclasses import dataclass
 
+from app.config.base import EnvDataclass
 
-class AuthSettings(BaseConfig):
+
+@dataclass(frozen=True, slots=True)
+class AuthSettings(EnvDataclass):
     SECRET_KEY: str
+    REFRESH_SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    REFRESH_SECRET_KEY: str
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12
+    # Key for HMAC-hashing server-generated tokens; falls back to SECRET_KEY
+    TOKEN_HMAC_KEY: str = ""
@@ -1,7 +1,109 @@
+import os
+import types
+from collections.abc import Callable
+from dataclasses import MISSING, asdict, fields
+from functools import lru_cache
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from dotenv import dotenv_values
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = ".env"
+
 
 class BaseConfig(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
     )
+
+    @classmethod
+    def from_env(cls):
+        return cls()
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]):
+        return cls.model_construct(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.model_dump()
+
+
+@lru_cache(maxsize=1)
+def _env_file_values() -> dict[str, str]:
+    return {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+_CONVERTERS: dict[Any, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _parse_bool,
+}
+
+
+def _converter_for(field_type: Any) -> Callable[[str], Any]:
+    """Return the env-string parser for a field type; X | None maps "" to None."""
+    if get_origin(field_type) in (Union, types.UnionType):
+        args = get_args(field_type)
+        inner = [arg for arg in args if arg is not type(None)]
+        if len(args) == 2 and len(inner) == 1:
+            convert = _converter_for(inner[0])
+            return lambda value: convert(value) if value else None
+
+    converter = _CONVERTERS.get(field_type)
+    if converter is None:
+        raise TypeError(f"Unsupported settings field type: {field_type!r}")
+    return converter
+
+
+class EnvDataclass:
+    """
+    Mixin for settings dataclasses with primitive fields and no validators.
+
+    Reads the same sources as BaseConfig (.env, overridden by os.environ)
+    without the pydantic model machinery. Field types are resolved when the
+    subclass is defined, so an unsupported type fails at import time.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._converters = {
+            name: _converter_for(field_type)
+            for name, field_type in get_type_hints(cls).items()
+        }
+
+    @classmethod
+    def from_env(cls):
+        env = {**_env_file_values(), **os.environ}
+        values = {}
+        for field in fields(cls):
+            if field.name in env:
+                values[field.name] = cls._converters[field.name](env[field.name])
+            elif field.default is MISSING:
+                raise ValueError(f"{cls.__name__}: {field.name} is not set")
+        return cls(**values)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]):
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
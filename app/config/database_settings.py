@@ -15,19 +15,47 @@ class DatabaseSettings(BaseConfig):
     # If set, individual POSTGRES_* variables are ignored.
     DATABASE_URL: str | None = None
 
+    # Optional read replica for analytics queries. Same URL forms as
+    # DATABASE_URL; when unset, analytics read from the primary.
+    DATABASE_READ_URL: str | None = None
+
     # Set to True on Railway/cloud (PostgreSQL requires SSL).
     DATABASE_SSL: bool = False
 
+    # Connection pool tuning (ignored when USE_PGBOUNCER is on).
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 20
+    POOL_RECYCLE: int = 1800
+    POOL_TIMEOUT: int = 10
+    # SELECT 1 before every checkout; off by default since POOL_RECYCLE and
+    # TCP keepalives already retire stale connections.
+    POOL_PRE_PING: bool = False
+    # Open POOL_SIZE connections at startup so the first requests do not each
+    # pay connect + TLS + auth.
+    POOL_WARMUP: bool = True
+
+    # Compiled SQL cache entries per engine (SQLAlchemy default 500). Every
+    # statement shape, e.g. each analytics page/cursor variant, takes an entry.
+    QUERY_CACHE_SIZE: int = 1200
+
+    # Set to True behind pgbouncer in transaction mode: pooling is left to
+    # pgbouncer and the app opens a fresh connection per checkout.
+    USE_PGBOUNCER: bool = False
+
+    @staticmethod
+    def _asyncpg_url(url: str) -> str:
+        # Railway provides postgresql://, asyncpg needs postgresql+asyncpg://
+        for prefix in ("postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                return "postgresql+asyncpg://" + url[len(prefix) :]
+        return url
+
     @model_validator(mode="after")
     def build_database_url(self) -> "DatabaseSettings":
+        if self.DATABASE_READ_URL:
+            self.DATABASE_READ_URL = self._asyncpg_url(self.DATABASE_READ_URL)
         if self.DATABASE_URL:
-            # Railway provides postgresql://, asyncpg needs postgresql+asyncpg://
-            url = self.DATABASE_URL
-            for prefix in ("postgresql://", "postgres://"):
-                if url.startswith(prefix):
-                    url = "postgresql+asyncpg://" + url[len(prefix) :]
-                    break
-            self.DATABASE_URL = url
+            self.DATABASE_URL = self._asyncpg_url(self.DATABASE_URL)
         else:
             self.DATABASE_URL = (
                 f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
@@ -12,6 +12,10 @@ class RedisSettings(BaseConfig):
     # If set, individual REDIS_* variables are ignored.
     REDIS_URL: str | None = None
 
+    # Shared connection pool: size and max seconds to wait for a free connection.
+    REDIS_POOL_SIZE: int = 50
+    REDIS_POOL_TIMEOUT: int = 2
+
     @model_validator(mode="after")
     def build_redis_url(self) -> "RedisSettings":
         if not self.REDIS_URL:
@@ -3,14 +3,56 @@ Auth0 integration utilities.
 Handles Auth0 token verification and user info extraction.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import time
+from typing import Any, Optional
 
-import requests
-from jose import jwt
-from jose.exceptions import JWTError
+import httpx
+import jwt
+import orjson
+from cachetools import TTLCache
+from jwt.exceptions import PyJWTError
+from redis.exceptions import RedisError
 
 from app.config import settings
+from app.core.jwt_codec import jwt_codec
 from app.core.logger import logger
+from app.core.redis import get_redis
+
+# Auth0 settings resolved once at import (read on every verification)
+_AUTH0_DOMAIN = settings.auth0.AUTH0_DOMAIN
+_AUTH0_AUDIENCE = settings.auth0.AUTH0_AUDIENCE
+_AUTH0_ALGORITHMS = settings.auth0.AUTH0_ALGORITHMS.split(",")
+_AUTH0_ISSUER = f"https://{_AUTH0_DOMAIN}/"
+_JWKS_URL = f"https://{_AUTH0_DOMAIN}/.well-known/jwks.json"
+
+# JWKS cache: kid -> ready-to-use public key, refreshed at most once per TTL
+_JWKS_TTL_SECONDS = 3600
+_JWKS_CACHE: dict[str, Any] = {}
+_JWKS_FETCHED_AT: float = 0.0
+_JWKS_LOCK = asyncio.Lock()
+
+# On-demand refetches (unknown kid, stale cache) run at most once per interval,
+# so tokens with made-up kids cannot turn every request into an Auth0 fetch
+_JWKS_MIN_REFETCH_SECONDS = 30
+_JWKS_REFETCHED_AT: float = 0.0
+
+# Shared JWKS copy in Redis (hash kid -> JWK JSON): one fetch warms all workers
+_JWKS_REDIS_KEY = "auth0:jwks"
+
+# Background refresher keeps the cache warm so verification never waits on HTTP
+_JWKS_REFRESH_INTERVAL_SECONDS = 600
+_jwks_refresher: Optional[asyncio.Task] = None
+
+# Verified payloads: blake2b(token) -> payload, so repeat calls skip RSA verify
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# Shared HTTP client: keeps the TLS connection to Auth0 alive between fetches
+_http_client = httpx.AsyncClient(
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=10),
+)
 
 
 class Auth0Error(Exception):
@@ -19,53 +61,193 @@ class Auth0Error(Exception):
     pass
 
 
-def get_auth0_public_key(token: str) -> Optional[dict]:
+async def close_http_client() -> None:
+    """Close the shared Auth0 HTTP client (called on application shutdown)."""
+    await _http_client.aclose()
+
+
+async def _fetch_jwks_from_auth0() -> dict[str, str]:
+    """Fetch JWKS from Auth0 and index the raw JWK JSON by kid."""
+    jwks_response = await _http_client.get(_JWKS_URL)
+    jwks_response.raise_for_status()
+    jwks = orjson.loads(jwks_response.content)
+
+    return {
+        key["kid"]: orjson.dumps(key).decode()
+        for key in jwks.get("keys", [])
+        if "kid" in key
+    }
+
+
+async def _load_shared_jwks() -> dict[str, str]:
+    try:
+        return await get_redis().hgetall(_JWKS_REDIS_KEY)
+    except RedisError as e:
+        logger.warning("Could not read JWKS from Redis, using Auth0: %s", e)
+        return {}
+
+
+async def _store_shared_jwks(jwks: dict[str, str]) -> None:
+    try:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.delete(_JWKS_REDIS_KEY)
+            pipe.hset(_JWKS_REDIS_KEY, mapping=jwks)
+            pipe.expire(_JWKS_REDIS_KEY, _JWKS_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not store JWKS in Redis: %s", e)
+
+
+async def _fetch_jwks(kid: str | None = None) -> dict[str, Any]:
+    """
+    Load JWKS and index the public keys by kid.
+
+    The Redis copy shared by all workers is used when it has the wanted
+    kid; otherwise keys are fetched from Auth0 and written back to Redis.
+    Redis errors fall back to fetching from Auth0 directly.
+
+    Keys are converted to cryptography key objects once here, so token
+    verification does not rebuild the RSA key for every request.
+    """
+    raw_jwks = await _load_shared_jwks()
+    if not raw_jwks or (kid is not None and kid not in raw_jwks):
+        raw_jwks = await _fetch_jwks_from_auth0()
+        if raw_jwks:
+            await _store_shared_jwks(raw_jwks)
+
+    jwk_set = jwt.PyJWKSet.from_dict(
+        {"keys": [orjson.loads(jwk) for jwk in raw_jwks.values()]}
+    )
+    return {jwk.key_id: jwk.key for jwk in jwk_set.keys if jwk.key_id}
+
+
+async def _get_cached_jwk(kid: str | None) -> Optional[Any]:
+    """
+    Return public key for kid from the in-process cache.
+
+    The background refresher normally keeps the cache fresh; this falls
+    back to a refetch when the cache is older than the TTL or an unknown
+    kid appears (Auth0 key rotation). Such refetches are throttled to one
+    per _JWKS_MIN_REFETCH_SECONDS: in between, a stale key is still served
+    and an unknown kid gets None. Tokens without a kid (e.g. local HS256
+    tokens) never trigger a fetch.
+    """
+    global _JWKS_REFETCHED_AT
+
+    if kid is None:
+        return None
+
+    key = _JWKS_CACHE.get(kid)
+    if key and time.time() - _JWKS_FETCHED_AT < _JWKS_TTL_SECONDS:
+        return key
+    if time.time() - _JWKS_REFETCHED_AT < _JWKS_MIN_REFETCH_SECONDS:
+        return key
+
+    async with _JWKS_LOCK:
+        # Another coroutine may have refreshed the cache while we were waiting
+        key = _JWKS_CACHE.get(kid)
+        if key and time.time() - _JWKS_FETCHED_AT < _JWKS_TTL_SECONDS:
+            return key
+        if time.time() - _JWKS_REFETCHED_AT < _JWKS_MIN_REFETCH_SECONDS:
+            return key
+
+        # Set before fetching, so a failing Auth0 call is throttled as well
+        _JWKS_REFETCHED_AT = time.time()
+        await _refresh_jwks_locked(kid)
+
+        return _JWKS_CACHE.get(kid)
+
+
+async def _refresh_jwks_locked(kid: str | None = None) -> None:
+    """Refetch JWKS into the cache. Caller must hold _JWKS_LOCK."""
+    global _JWKS_CACHE, _JWKS_FETCHED_AT
+
+    jwks = await _fetch_jwks(kid)
+    if jwks.keys() != _JWKS_CACHE.keys():
+        # Signing keys rotated: drop payloads verified with the old set
+        _TOKEN_CACHE.clear()
+    _JWKS_CACHE = jwks
+    _JWKS_FETCHED_AT = time.time()
+
+
+async def _jwks_refresher_loop() -> None:
+    while True:
+        try:
+            async with _JWKS_LOCK:
+                await _refresh_jwks_locked()
+        except Exception as e:
+            # Keep serving the previous keys; the next tick retries
+            logger.warning("Background JWKS refresh failed: %s", e)
+        await asyncio.sleep(_JWKS_REFRESH_INTERVAL_SECONDS)
+
+
+def start_jwks_refresher() -> None:
+    """Start periodic JWKS refresh (called on application startup)."""
+    global _jwks_refresher
+
+    if _jwks_refresher is None or _jwks_refresher.done():
+        _jwks_refresher = asyncio.create_task(_jwks_refresher_loop())
+
+
+async def stop_jwks_refresher() -> None:
+    """Cancel the JWKS refresher task (called on application shutdown)."""
+    global _jwks_refresher
+
+    if _jwks_refresher is None:
+        return
+    _jwks_refresher.cancel()
+    try:
+        await _jwks_refresher
+    except asyncio.CancelledError:
+        pass
+    _jwks_refresher = None
+
+
+async def get_auth0_public_key(token: str) -> Optional[Any]:
     """
     Get Auth0 public key (JWKS) for token verification.
 
     Auth0 uses RS256 algorithm with rotating keys.
-    We need to fetch the public key from Auth0 JWKS endpoint.
+    Keys are fetched from the Auth0 JWKS endpoint and cached by kid,
+    so steady-state verification does not hit the network.
 
     Args:
         token: JWT token from Auth0
 
     Returns:
-        Public key dict or None if error
+        Public key object or None if error
     """
     try:
         # Get token header to find key ID (kid)
         unverified_header = jwt.get_unverified_header(token)
 
-        # Fetch JWKS from Auth0
-        jwks_url = f"https://{settings.auth0.AUTH0_DOMAIN}/.well-known/jwks.json"
-        jwks_response = requests.get(jwks_url, timeout=10)
-        jwks_response.raise_for_status()
-        jwks = jwks_response.json()
+        kid = unverified_header.get("kid")
+        key = await _get_cached_jwk(kid)
+        if key:
+            logger.debug("Found matching public key for kid: %s", kid)
+            return key
 
-        # Find the key matching token's kid
-        for key in jwks.get("keys", []):
-            if key.get("kid") == unverified_header.get("kid"):
-                logger.debug(f"Found matching public key for kid: {key.get('kid')}")
-                return key
-
-        logger.warning(f"No matching key found for kid: {unverified_header.get('kid')}")
+        logger.warning("No matching key found for kid: %s", kid)
         return None
 
-    except requests.RequestException as e:
-        logger.error(f"Error fetching JWKS from Auth0: {str(e)}")
+    except httpx.HTTPError as e:
+        logger.error("Error fetching JWKS from Auth0: %s", e)
         return None
-    except JWTError as e:
-        logger.error(f"Error parsing token header: {str(e)}")
+    except PyJWTError as e:
+        logger.error("Error parsing token header: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error getting Auth0 public key: {str(e)}")
+        logger.error("Unexpected error getting Auth0 public key: %s", e)
         return None
 
 
-def verify_auth0_token(token: str) -> Optional[dict]:
+async def verify_auth0_token(token: str) -> Optional[dict]:
     """
     Verify Auth0 JWT token and extract payload.
 
+    Successfully verified payloads are cached by token hash until the
+    cache TTL or the token's own exp, whichever comes first.
+
     Args:
         token: JWT token from Auth0
 
@@ -75,36 +257,42 @@ def verify_auth0_token(token: str) -> Optional[dict]:
     Raises:
         Auth0Error: If token verification fails
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None and cached.get("exp", 0) > time.time():
+        return cached
+
     try:
         # Get public key for verification
-        public_key = get_auth0_public_key(token)
+        public_key = await get_auth0_public_key(token)
         if not public_key:
             logger.warning("Could not retrieve Auth0 public key")
             raise Auth0Error("Could not retrieve Auth0 public key")
 
         # Verify and decode token
-        payload = jwt.decode(
+        payload = jwt_codec.decode(
             token,
             public_key,
-            algorithms=settings.auth0.AUTH0_ALGORITHMS,
-            audience=settings.auth0.AUTH0_AUDIENCE,
-            issuer=f"https://{settings.auth0.AUTH0_DOMAIN}/",
+            algorithms=_AUTH0_ALGORITHMS,
+            audience=_AUTH0_AUDIENCE,
+            issuer=_AUTH0_ISSUER,
         )
 
         logger.info(
-            f"Auth0 token verified successfully for subject: {payload.get('sub')}"
+            "Auth0 token verified successfully for subject: %s", payload.get("sub")
         )
+        _TOKEN_CACHE[cache_key] = payload
         return payload
 
-    except JWTError as e:
-        logger.warning(f"Auth0 token verification failed: {str(e)}")
+    except PyJWTError as e:
+        logger.warning("Auth0 token verification failed: %s", e)
         raise Auth0Error(f"Invalid Auth0 token: {str(e)}")
     except Exception as e:
-        logger.error(f"Error verifying Auth0 token: {str(e)}")
+        logger.error("Error verifying Auth0 token: %s", e)
         raise Auth0Error(f"Error verifying Auth0 token: {str(e)}")
 
 
-def get_email_from_auth0_token(token: str) -> Optional[str]:
+async def get_email_from_auth0_token(token: str) -> Optional[str]:
     """
     Extract email from Auth0 token.
 
@@ -115,20 +303,20 @@ def get_email_from_auth0_token(token: str) -> Optional[str]:
         User email if found, None otherwise
     """
     try:
-        payload = verify_auth0_token(token)
+        payload = await verify_auth0_token(token)
 
         email = payload.get("email")
 
         if email:
-            logger.debug(f"Extracted email from Auth0 token: {email}")
+            logger.debug("Extracted email from Auth0 token: %s", email)
             return email
 
         logger.warning("No email found in Auth0 token")
         return None
 
     except Auth0Error as e:
-        logger.warning(f"Could not extract email from token: {str(e)}")
+        logger.warning("Could not extract email from token: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Error extracting email from Auth0 token: {str(e)}")
+        logger.error("Error extracting email from Auth0 token: %s", e)
         return None
@@ -1,36 +1,140 @@
+import asyncio
+from functools import lru_cache
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.core.logger import logger
 
 _connect_args = {"ssl": "require"} if settings.database.DATABASE_SSL else {}
 
-# Create async engine
-engine = create_async_engine(
-    settings.database.DATABASE_URL,
-    echo=settings.database.DATABASE_ECHO,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    connect_args=_connect_args,
-)
+if settings.database.USE_PGBOUNCER:
+    # pgbouncer already pools server connections; a second pool here would
+    # pin them and defeat transaction pooling.
+    _pool_args = {"poolclass": NullPool}
+    # Prepared statements do not survive pgbouncer switching the server
+    # connection between transactions, so disable both statement caches.
+    _connect_args |= {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+else:
+    # JIT compilation only pays off for long analytic queries; ours are short.
+    # Keepalives let the server drop dead clients without a per-checkout ping.
+    # Not sent through pgbouncer, which rejects unknown startup parameters.
+    _connect_args["server_settings"] = {"jit": "off", "tcp_keepalives_idle": "60"}
+    _pool_args = {
+        "pool_size": settings.database.POOL_SIZE,
+        "max_overflow": settings.database.MAX_OVERFLOW,
+        "pool_recycle": settings.database.POOL_RECYCLE,
+        "pool_timeout": settings.database.POOL_TIMEOUT,
+    }
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Create the async engine on first use, so importing models opens no pool."""
+    return create_async_engine(
+        settings.database.DATABASE_URL,
+        echo=settings.database.DATABASE_ECHO,
+        future=True,
+        pool_pre_ping=settings.database.POOL_PRE_PING,
+        query_cache_size=settings.database.QUERY_CACHE_SIZE,
+        connect_args=_connect_args,
+        **_pool_args,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession] | None:
+    """
+    Sessions on the DATABASE_READ_URL replica, or None when it is not set.
+
+    Transactions there are READ ONLY, so a stray write fails instead of
+    landing on the replica.
+    """
+    if not settings.database.DATABASE_READ_URL:
+        return None
+
+    engine = create_async_engine(
+        settings.database.DATABASE_READ_URL,
+        echo=settings.database.DATABASE_ECHO,
+        pool_pre_ping=settings.database.POOL_PRE_PING,
+        query_cache_size=settings.database.QUERY_CACHE_SIZE,
+        connect_args=_connect_args,
+        execution_options={"postgresql_readonly": True},
+        **_pool_args,
+    )
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+async def warm_up_pool() -> None:
+    """
+    Fill the connection pool at startup (called from the app lifespan).
+
+    Connections are opened concurrently and returned to the pool right away.
+    Failures are logged, not raised: the app still starts and connects
+    lazily as before.
+    """
+    if settings.database.USE_PGBOUNCER or not settings.database.POOL_WARMUP:
+        return
+
+    engine = get_engine()
+
+    async def _open():
+        return await engine.connect()
+
+    results = await asyncio.gather(
+        *(_open() for _ in range(settings.database.POOL_SIZE)),
+        return_exceptions=True,
+    )
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Database pool warm-up connection failed: %s", result)
+        else:
+            await result.close()
+            opened += 1
+    logger.info("Database pool warmed up with %s connections", opened)
+
+
+async def close_db() -> None:
+    """Dispose the engine pools (called on application shutdown)."""
+    engines = []
+    if get_engine.cache_info().currsize:
+        engines.append(get_engine())
+    if get_read_sessionmaker.cache_info().currsize and get_read_sessionmaker():
+        engines.append(get_read_sessionmaker().kw["bind"])
+
+    await asyncio.gather(*(engine.dispose() for engine in engines))
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
 
 # Base class for models
 Base = declarative_base()
 
 
 async def get_raw_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
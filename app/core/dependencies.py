@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from fastapi import Depends, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -16,7 +18,9 @@ from app.services import (
     QuizService,
     RedisQuizService,
     RequestService,
+    UnreadCountCache,
     UserService,
+    UserStatsCache,
 )
 from app.services.analytics.company_analytics_service import CompanyAnalyticsService
 from app.services.analytics.user_analytics_service import UserAnalyticsService
@@ -30,21 +34,164 @@ def get_uow() -> AbstractUnitOfWork:
     return SQLAlchemyUnitOfWork()
 
 
-def get_notification_service(
+def get_redis_quiz_service() -> RedisQuizService:
+    redis = get_redis()
+    return RedisQuizService(redis)
+
+
+def get_unread_count_cache() -> UnreadCountCache:
+    return UnreadCountCache(get_redis())
+
+
+@lru_cache(maxsize=1)
+def get_user_stats_cache() -> UserStatsCache:
+    # One instance per process: it owns the in-process tier of the cache
+    return UserStatsCache(get_redis())
+
+
+class RequestServices:
+    """
+    Request-scoped service container.
+
+    Shares one UoW between all services of a request and builds each
+    service lazily, only when an endpoint (or another service) needs it.
+    """
+
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        manager: WebSocketManager,
+        redis_quiz_service: RedisQuizService,
+        unread_cache: UnreadCountCache | None = None,
+        stats_cache: UserStatsCache | None = None,
+    ):
+        self.uow = uow
+        self.manager = manager
+        self.redis_quiz_service = redis_quiz_service
+        self.unread_cache = unread_cache
+        self.stats_cache = stats_cache
+
+    @cached_property
+    def websocket_service(self) -> WebSocketService:
+        return WebSocketService(manager=self.manager)
+
+    @cached_property
+    def notification_service(self) -> NotificationService:
+        return NotificationService(
+            uow=self.uow,
+            websocket_service=self.websocket_service,
+            unread_cache=self.unread_cache,
+        )
+
+    @cached_property
+    def user_service(self) -> UserService:
+        return UserService(uow=self.uow)
+
+    @cached_property
+    def auth_service(self) -> AuthService:
+        return AuthService(uow=self.uow, user_service=self.user_service)
+
+    @cached_property
+    def permission_service(self) -> PermissionService:
+        return PermissionService(uow=self.uow)
+
+    @cached_property
+    def company_service(self) -> CompanyService:
+        return CompanyService(uow=self.uow, permission_service=self.permission_service)
+
+    @cached_property
+    def member_service(self) -> MemberService:
+        return MemberService(uow=self.uow, permission_service=self.permission_service)
+
+    @cached_property
+    def admin_service(self) -> AdminService:
+        return AdminService(
+            uow=self.uow,
+            permission_service=self.permission_service,
+            company_service=self.company_service,
+        )
+
+    @cached_property
+    def invitation_service(self) -> InvitationService:
+        return InvitationService(
+            uow=self.uow, permission_service=self.permission_service
+        )
+
+    @cached_property
+    def request_service(self) -> RequestService:
+        return RequestService(uow=self.uow, permission_service=self.permission_service)
+
+    @cached_property
+    def quiz_service(self) -> QuizService:
+        return QuizService(
+            uow=self.uow,
+            permission_service=self.permission_service,
+            notification_service=self.notification_service,
+            websocket_service=self.websocket_service,
+        )
+
+    @cached_property
+    def quiz_attempt_service(self) -> QuizAttemptService:
+        return QuizAttemptService(
+            uow=self.uow,
+            permission_service=self.permission_service,
+            quiz_service=self.quiz_service,
+            redis_quiz_service=self.redis_quiz_service,
+            stats_cache=self.stats_cache,
+        )
+
+    @cached_property
+    def quiz_import_service(self) -> QuizImportService:
+        return QuizImportService(
+            uow=self.uow,
+            permission_service=self.permission_service,
+            quiz_service=self.quiz_service,
+        )
+
+    @cached_property
+    def quiz_export_service(self) -> QuizExportService:
+        return QuizExportService(
+            uow=self.uow,
+            permission_service=self.permission_service,
+            quiz_service=self.quiz_service,
+        )
+
+    @cached_property
+    def user_analytics_service(self) -> UserAnalyticsService:
+        return UserAnalyticsService(uow=self.uow)
+
+    @cached_property
+    def company_analytics_service(self) -> CompanyAnalyticsService:
+        return CompanyAnalyticsService(uow=self.uow, admin_service=self.admin_service)
+
+
+def get_services(
     uow: AbstractUnitOfWork = Depends(get_uow),
     manager: WebSocketManager = Depends(get_websocket_manager),
-) -> NotificationService:
-    websocket_service = WebSocketService(manager=manager)
-    return NotificationService(uow=uow, websocket_service=websocket_service)
+    redis_quiz_service: RedisQuizService = Depends(get_redis_quiz_service),
+    unread_cache: UnreadCountCache = Depends(get_unread_count_cache),
+    stats_cache: UserStatsCache = Depends(get_user_stats_cache),
+) -> RequestServices:
+    return RequestServices(
+        uow=uow,
+        manager=manager,
+        redis_quiz_service=redis_quiz_service,
+        unread_cache=unread_cache,
+        stats_cache=stats_cache,
+    )
 
 
-def get_redis_quiz_service() -> RedisQuizService:
-    redis = get_redis()
-    return RedisQuizService(redis)
+# Thin per-service providers kept for routers and test overrides.
+
+
+def get_notification_service(
+    services: RequestServices = Depends(get_services),
+) -> NotificationService:
+    return services.notification_service
 
 
 def get_websocket_service(
-    manager: WebSocketManager = Depends(get_websocket_manager),
+    services: RequestServices = Depends(get_services),
 ) -> WebSocketService:
     """
     Dependency для WebSocketService.
@@ -52,130 +199,85 @@ def get_websocket_service(
     Returns:
         WebSocketService instance з injected WebSocketManager
     """
-    return WebSocketService(manager=manager)
+    return services.websocket_service
 
 
-def get_user_service(uow: AbstractUnitOfWork = Depends(get_uow)) -> UserService:
-    return UserService(uow=uow)
+def get_user_service(services: RequestServices = Depends(get_services)) -> UserService:
+    return services.user_service
 
 
-def get_auth_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    user_service: UserService = Depends(get_user_service),
-) -> AuthService:
-    return AuthService(uow=uow, user_service=user_service)
+def get_auth_service(services: RequestServices = Depends(get_services)) -> AuthService:
+    return services.auth_service
 
 
 def get_permission_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
+    services: RequestServices = Depends(get_services),
 ) -> PermissionService:
-    return PermissionService(uow=uow)
+    return services.permission_service
 
 
 def get_company_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
+    services: RequestServices = Depends(get_services),
 ) -> CompanyService:
-    return CompanyService(uow=uow, permission_service=permission_service)
+    return services.company_service
 
 
 def get_member_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
+    services: RequestServices = Depends(get_services),
 ) -> MemberService:
-    return MemberService(uow=uow, permission_service=permission_service)
+    return services.member_service
 
 
 def get_admin_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
-    company_service: CompanyService = Depends(get_company_service),
+    services: RequestServices = Depends(get_services),
 ) -> AdminService:
-    return AdminService(
-        uow=uow, permission_service=permission_service, company_service=company_service
-    )
+    return services.admin_service
 
 
 def get_invitation_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
+    services: RequestServices = Depends(get_services),
 ) -> InvitationService:
-    return InvitationService(uow=uow, permission_service=permission_service)
+    return services.invitation_service
 
 
 def get_request_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
+    services: RequestServices = Depends(get_services),
 ) -> RequestService:
-    return RequestService(uow=uow, permission_service=permission_service)
+    return services.request_service
 
 
-def get_quiz_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
-    notification_service: NotificationService = Depends(get_notification_service),
-    websocket_service: WebSocketService = Depends(get_websocket_service),
-) -> QuizService:
-    return QuizService(
-        uow=uow,
-        permission_service=permission_service,
-        notification_service=notification_service,
-        websocket_service=websocket_service,
-    )
+def get_quiz_service(services: RequestServices = Depends(get_services)) -> QuizService:
+    return services.quiz_service
 
 
 def get_quiz_attempt_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
-    quiz_service: QuizService = Depends(get_quiz_service),
-    redis_quiz_service: RedisQuizService = Depends(get_redis_quiz_service),
+    services: RequestServices = Depends(get_services),
 ) -> QuizAttemptService:
-    return QuizAttemptService(
-        uow=uow,
-        permission_service=permission_service,
-        quiz_service=quiz_service,
-        redis_quiz_service=redis_quiz_service,
-    )
+    return services.quiz_attempt_service
 
 
 def get_quiz_import_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
-    quiz_service: QuizService = Depends(get_quiz_service),
+    services: RequestServices = Depends(get_services),
 ) -> QuizImportService:
-    return QuizImportService(
-        uow=uow,
-        permission_service=permission_service,
-        quiz_service=quiz_service,
-    )
+    return services.quiz_import_service
 
 
 def get_quiz_export_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    permission_service: PermissionService = Depends(get_permission_service),
-    quiz_service: QuizService = Depends(get_quiz_service),
+    services: RequestServices = Depends(get_services),
 ) -> QuizExportService:
-    return QuizExportService(
-        uow=uow,
-        permission_service=permission_service,
-        quiz_service=quiz_service,
-    )
+    return services.quiz_export_service
 
 
 def get_user_analytics_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
+    services: RequestServices = Depends(get_services),
 ) -> UserAnalyticsService:
-    return UserAnalyticsService(uow=uow)
+    return services.user_analytics_service
 
 
 def get_company_analytics_service(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-    admin_service: AdminService = Depends(get_admin_service),
+    services: RequestServices = Depends(get_services),
 ) -> CompanyAnalyticsService:
-    return CompanyAnalyticsService(
-        uow=uow,
-        admin_service=admin_service,
-    )
+    return services.company_analytics_service
 
 
 # HTTPBearer scheme for token authentication
@@ -1,14 +1,31 @@
 """Custom exceptions for the application."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from fastapi import HTTPException, WebSocketException, status
 
 
 # --- Base exception --- #
 class BaseAppException(HTTPException):
-    """Base exception for all app exceptions."""
+    """
+    Base exception for all app exceptions.
+
+    Subclasses declare status_code, default_detail and headers at class
+    level; raising one only needs the detail. Class-level headers are
+    shared by every instance and only read by the exception handler.
+    """
+
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    default_detail: str = "Internal server error"
+    headers: Mapping[str, str] | None = None
 
-    def __init__(self, status_code: int, detail: str):
-        super().__init__(status_code=status_code, detail=detail)
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            status_code=self.status_code,
+            detail=self.default_detail if detail is None else detail,
+            headers=self.headers,
+        )
 
 
 # --- Generic HTTP exceptions --- #
@@ -17,39 +34,38 @@ class BaseAppException(HTTPException):
 class BadRequestException(BaseAppException):
     """Invalid request or business logic violation (400)."""
 
-    def __init__(self, detail: str = "Bad request"):
-        super().__init__(status.HTTP_400_BAD_REQUEST, detail)
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "Bad request"
 
 
 class UnauthorizedException(BaseAppException):
     """Authentication failed (401)."""
 
-    def __init__(self, detail: str = "Could not validate credentials"):
-        super().__init__(status.HTTP_401_UNAUTHORIZED, detail)
-        self.headers = {"WWW-Authenticate": "Bearer"}
+    status_code = status.HTTP_401_UNAUTHORIZED
+    default_detail = "Could not validate credentials"
+    # Shared by every raise, so read-only to guard against in-place edits
+    headers = MappingProxyType({"WWW-Authenticate": "Bearer"})
 
 
 class PermissionDeniedException(BaseAppException):
     """Permission denied (403)."""
 
-    def __init__(
-        self, detail: str = "You don't have permission to perform this action"
-    ):
-        super().__init__(status.HTTP_403_FORBIDDEN, detail)
+    status_code = status.HTTP_403_FORBIDDEN
+    default_detail = "You don't have permission to perform this action"
 
 
 class NotFoundException(BaseAppException):
     """Resource not found (404)."""
 
-    def __init__(self, detail: str = "Resource not found"):
-        super().__init__(status.HTTP_404_NOT_FOUND, detail)
+    status_code = status.HTTP_404_NOT_FOUND
+    default_detail = "Resource not found"
 
 
 class ConflictException(BaseAppException):
     """Resource conflict - duplicate or already exists (409)."""
 
-    def __init__(self, detail: str = "Resource already exists"):
-        super().__init__(status.HTTP_409_CONFLICT, detail)
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Resource already exists"
 
 
 # --- Internal server error --- #
@@ -58,8 +74,8 @@ class ConflictException(BaseAppException):
 class ServiceException(BaseAppException):
     """Internal server error (500) - use only for unexpected errors."""
 
-    def __init__(self, detail: str = "Internal server error"):
-        super().__init__(status.HTTP_500_INTERNAL_SERVER_ERROR, detail)
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    default_detail = "Internal server error"
 
 
 class RedisException(ServiceException):
@@ -70,8 +86,7 @@ class RedisException(ServiceException):
     and decouple application code from Redis library internals.
     """
 
-    def __init__(self, detail: str = "Redis operation failed"):
-        super().__init__(detail)
+    default_detail = "Redis operation failed"
 
 
 class WebSocketAuthException(WebSocketException):
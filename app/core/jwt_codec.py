@@ -0,0 +1,39 @@
+"""PyJWT with orjson payload (de)serialization."""
+
+from typing import Any
+
+import orjson
+from jwt import PyJWT
+from jwt.exceptions import DecodeError
+
+
+class OrjsonPyJWT(PyJWT):
+    """
+    PyJWT whose claims are encoded/decoded with orjson instead of stdlib json.
+
+    Uses the payload hooks PyJWT provides for subclasses; signing and claim
+    validation are unchanged.
+    """
+
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: dict[str, Any] | None = None,
+        json_encoder=None,
+    ) -> bytes:
+        if json_encoder is not None:
+            return super()._encode_payload(payload, headers, json_encoder)
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+# Shared instance: use jwt_codec.encode/decode in place of jwt.encode/decode
+jwt_codec = OrjsonPyJWT()
@@ -1,9 +1,17 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logger(name: str = "app", level: int = logging.INFO) -> logging.Logger:
-    """Creates and configures a logger for the application."""
+    """
+    Creates and configures a logger for the application.
+
+    Records are handed to a queue and written to stdout by a background
+    listener thread, so request handlers never block on the stream write.
+    """
     logger = logging.getLogger(name)
 
     if not logger.handlers:
@@ -14,7 +22,14 @@ def setup_logger(name: str = "app", level: int = logging.INFO) -> logging.Logger
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S"
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        # Flush whatever is still queued when the process exits
+        atexit.register(listener.stop)
+
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -1,4 +1,4 @@
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.config import settings
 
@@ -10,9 +10,23 @@ def get_redis() -> Redis:
     global redis_client
 
     if redis_client is None:
-        redis_client = Redis.from_url(
+        # Blocking pool: when all connections are busy, callers wait up to
+        # REDIS_POOL_TIMEOUT for a free one instead of failing immediately.
+        pool = BlockingConnectionPool.from_url(
             settings.redis.REDIS_URL,
+            max_connections=settings.redis.REDIS_POOL_SIZE,
+            timeout=settings.redis.REDIS_POOL_TIMEOUT,
             decode_responses=True,
         )
+        redis_client = Redis(connection_pool=pool)
 
     return redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client and its pool (called on application shutdown)."""
+    global redis_client
+
+    if redis_client is not None:
+        await redis_client.aclose(close_connection_pool=True)
+        redis_client = None
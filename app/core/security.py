@@ -1,14 +1,68 @@
-import uuid
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from cachetools import TTLCache
+from jwt.utils import base64url_encode
 
 from app.config import settings
+from app.core.jwt_codec import jwt_codec
 from app.core.logger import logger
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Secrets encoded once for HMAC signing/verification (PyJWT takes bytes keys)
+_ACCESS_SECRET = settings.auth.SECRET_KEY.encode()
+_REFRESH_SECRET = settings.auth.REFRESH_SECRET_KEY.encode()
+_ALGORITHM = settings.auth.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+
+
+def _verification_key(secret: bytes) -> jwt.PyJWK:
+    """
+    Wrap an HMAC secret as a PyJWK bound to the configured algorithm.
+
+    PyJWT uses a PyJWK's algorithm object and prepared key as-is on decode,
+    skipping the per-call algorithm lookup and key preparation.
+    """
+    jwk = {"kty": "oct", "k": base64url_encode(secret).decode("ascii")}
+    return jwt.PyJWK(jwk, algorithm=_ALGORITHM)
+
+
+# Decode keys prepared once at import
+_ACCESS_KEY = _verification_key(_ACCESS_SECRET)
+_REFRESH_KEY = _verification_key(_REFRESH_SECRET)
+
+# Default token lifetimes in seconds, computed once instead of per issued token
+_ACCESS_TTL_S = settings.auth.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL_S = settings.auth.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# Verified payloads: (token_type, sha256(token)) -> payload. Only valid tokens
+# are stored, and hits are re-checked against exp. Guarded by a lock because
+# sync endpoints decode from worker threads.
+_decode_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+_decode_cache_lock = threading.Lock()
+
+# High-entropy server-generated secrets are hashed with HMAC, not bcrypt
+_TOKEN_HMAC_KEY = (settings.auth.TOKEN_HMAC_KEY or settings.auth.SECRET_KEY).encode()
+
+# bcrypt parameters resolved once: cost factor and the $2b$ hash ident
+_BCRYPT_ROUNDS = settings.auth.BCRYPT_ROUNDS
+_BCRYPT_PREFIX = b"2b"
+
+# bcrypt releases the GIL, so hashing runs in parallel on its own bounded pool
+# instead of competing with request work in Starlette's default threadpool.
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
 
 
 # ---------------------- PASSWORD UTILS ---------------------- #
@@ -16,65 +70,111 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str) -> str:
     try:
-        hashed = pwd_context.hash(password)
-        logger.debug("Password hashed successfully")
-        return hashed
+        salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS, prefix=_BCRYPT_PREFIX)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("ascii")
     except Exception as e:
-        logger.error(f"Error hashing password: {str(e)}")
+        logger.error("Error hashing password: %s", e)
         raise
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not hashed_password.startswith("$2"):
+        # Not a bcrypt hash (e.g. external account with a hash_token() secret)
+        return False
     try:
-        result = pwd_context.verify(plain_password, hashed_password)
-        if result:
-            logger.debug("Password verification successful")
-        else:
+        result = bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("ascii")
+        )
+        if not result:
             logger.debug("Password verification failed")
         return result
     except Exception as e:
-        logger.error(f"Error verifying password: {str(e)}")
+        logger.error("Error verifying password: %s", e)
         return False
 
 
+def hash_token(token: str) -> str:
+    """
+    Hash a random, server-generated secret (not a user password).
+
+    Such values already carry enough entropy, so a keyed HMAC-SHA256 is
+    sufficient and costs microseconds instead of a bcrypt round.
+    """
+    return hmac.new(_TOKEN_HMAC_KEY, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def verify_token(token: str, hashed_token: str) -> bool:
+    return hmac.compare_digest(hash_token(token), hashed_token)
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, verify_password, plain_password, hashed_password
+    )
+
+
 # ---------------------- TOKEN HELPERS ---------------------- #
 
 
+def _seconds(delta: timedelta) -> int:
+    return int(delta.total_seconds())
+
+
 def _create_token(
-    data: dict, secret_key: str, expires_delta: timedelta, token_type: str
+    data: dict, secret_key: bytes, ttl_seconds: int, token_type: str
 ) -> str:
     """Internal helper for JWT creation."""
     try:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + expires_delta
-        to_encode.update({"exp": expire, "jti": str(uuid.uuid4())})
-
-        encoded_jwt = jwt.encode(
-            to_encode, secret_key, algorithm=settings.auth.ALGORITHM
-        )
-        logger.debug(
-            f"{token_type.capitalize()} token created successfully for subject: {data.get('sub')} "
-            f"(jti={to_encode['jti']})"
+        to_encode.update(
+            {"exp": int(time.time()) + ttl_seconds, "jti": secrets.token_hex(16)}
         )
+
+        encoded_jwt = jwt_codec.encode(to_encode, secret_key, algorithm=_ALGORITHM)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s token created successfully for subject: %s (jti=%s)",
+                token_type.capitalize(),
+                data.get("sub"),
+                to_encode["jti"],
+            )
         return encoded_jwt
     except Exception as e:
-        logger.error(f"Error creating {token_type} token: {str(e)}")
+        logger.error("Error creating %s token: %s", token_type, e)
         raise
 
 
-def _decode_token(token: str, secret_key: str, token_type: str) -> Optional[dict]:
-    """Internal helper for JWT decoding."""
+def _decode_token(token: str, key: jwt.PyJWK, token_type: str) -> Optional[dict]:
+    """Internal helper for JWT decoding (recently verified tokens are cached)."""
+    cache_key = (token_type, hashlib.sha256(token.encode()).digest())
+    with _decode_cache_lock:
+        cached = _decode_cache.get(cache_key)
+    if cached is not None and cached["exp"] > time.time():
+        return cached
+
     try:
-        payload = jwt.decode(token, secret_key, algorithms=[settings.auth.ALGORITHM])
-        logger.debug(
-            f"{token_type.capitalize()} token decoded successfully for subject: {payload.get('sub')}"
-        )
+        payload = jwt_codec.decode(token, key, algorithms=_ALGORITHMS)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s token decoded successfully for subject: %s",
+                token_type.capitalize(),
+                payload.get("sub"),
+            )
+        if "exp" in payload:
+            with _decode_cache_lock:
+                _decode_cache[cache_key] = payload
         return payload
-    except JWTError as e:
-        logger.warning(f"Invalid {token_type} token: {str(e)}")
+    except jwt.PyJWTError as e:
+        logger.warning("Invalid %s token: %s", token_type, e)
         return None
     except Exception as e:
-        logger.error(f"Error decoding {token_type} token: {str(e)}")
+        logger.error("Error decoding %s token: %s", token_type, e)
         return None
 
 
@@ -83,17 +183,15 @@ def _decode_token(token: str, secret_key: str, token_type: str) -> Optional[dict
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     try:
-        delta = expires_delta or timedelta(
-            minutes=settings.auth.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-        return _create_token(data, settings.auth.SECRET_KEY, delta, token_type="access")
+        ttl = _ACCESS_TTL_S if expires_delta is None else _seconds(expires_delta)
+        return _create_token(data, _ACCESS_SECRET, ttl, token_type="access")
     except Exception as e:
-        logger.error(f"Failed to create access token: {str(e)}")
+        logger.error("Failed to create access token: %s", e)
         raise
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    return _decode_token(token, settings.auth.SECRET_KEY, token_type="access")
+    return _decode_token(token, _ACCESS_KEY, token_type="access")
 
 
 # ---------------------- REFRESH TOKEN ---------------------- #
@@ -101,14 +199,12 @@ def decode_access_token(token: str) -> Optional[dict]:
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     try:
-        delta = expires_delta or timedelta(days=settings.auth.REFRESH_TOKEN_EXPIRE_DAYS)
-        return _create_token(
-            data, settings.auth.REFRESH_SECRET_KEY, delta, token_type="refresh"
-        )
+        ttl = _REFRESH_TTL_S if expires_delta is None else _seconds(expires_delta)
+        return _create_token(data, _REFRESH_SECRET, ttl, token_type="refresh")
     except Exception as e:
-        logger.error(f"Failed to create refresh token: {str(e)}")
+        logger.error("Failed to create refresh token: %s", e)
         raise
 
 
 def decode_refresh_token(token: str) -> Optional[dict]:
-    return _decode_token(token, settings.auth.REFRESH_SECRET_KEY, token_type="refresh")
+    return _decode_token(token, _REFRESH_KEY, token_type="refresh")
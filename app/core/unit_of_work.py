@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import get_read_sessionmaker, get_sessionmaker
 from app.db import (
     CompanyAnalyticsRepository,
     CompanyMemberRepository,
@@ -51,25 +52,30 @@ class AbstractUnitOfWork(ABC):
 
 
 class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
+    """
+    Repositories are built lazily on first access within a UoW scope, so a
+    scope that only touches users does not construct the other twelve.
+
+    Analytics repositories read through read_session, which is a session on
+    the read replica when one is configured and the main session otherwise.
+    """
+
+    _repository_names = tuple(AbstractUnitOfWork.__annotations__)
+    _lazy_names = _repository_names + ("read_session",)
+
     def __init__(self):
-        self.session_factory = AsyncSessionLocal
+        self.session_factory = get_sessionmaker()
+        self.read_session_factory = get_read_sessionmaker()
+
+    def _reset_repositories(self) -> None:
+        # cached_property stores values in __dict__; drop them so the next
+        # access binds to the current session
+        for name in self._lazy_names:
+            self.__dict__.pop(name, None)
 
     async def __aenter__(self):
         self.session = self.session_factory()
-
-        self.company_analytic = CompanyAnalyticsRepository(session=self.session)
-        self.user_analytic = UserAnalyticsRepository(session=self.session)
-        self.company_member = CompanyMemberRepository(session=self.session)
-        self.companies = CompanyRepository(session=self.session)
-        self.invitations = InvitationRepository(session=self.session)
-        self.notifications = NotificationRepository(session=self.session)
-        self.quiz_answer = QuizAnswerRepository(session=self.session)
-        self.quiz_attempt = QuizAttemptRepository(session=self.session)
-        self.quiz_question = QuizQuestionRepository(session=self.session)
-        self.quiz_user_answer = QuizUserAnswerRepository(session=self.session)
-        self.quiz = QuizRepository(session=self.session)
-        self.requests = RequestRepository(session=self.session)
-        self.users = UserRepository(session=self.session)
+        self._reset_repositories()
 
         return self
 
@@ -77,9 +83,71 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
         if exc_type is not None:
             await self.rollback()
         await self.session.close()
+        read_session = self.__dict__.get("read_session")
+        if read_session is not None and read_session is not self.session:
+            await read_session.close()
+        self._reset_repositories()
+
+    @cached_property
+    def read_session(self):
+        if self.read_session_factory is None:
+            return self.session
+        return self.read_session_factory()
 
     async def commit(self):
         await self.session.commit()
 
     async def rollback(self):
         await self.session.rollback()
+
+    @cached_property
+    def company_analytic(self) -> CompanyAnalyticsRepository:
+        return CompanyAnalyticsRepository(session=self.read_session)
+
+    @cached_property
+    def user_analytic(self) -> UserAnalyticsRepository:
+        return UserAnalyticsRepository(session=self.read_session)
+
+    @cached_property
+    def company_member(self) -> CompanyMemberRepository:
+        return CompanyMemberRepository(session=self.session)
+
+    @cached_property
+    def companies(self) -> CompanyRepository:
+        return CompanyRepository(session=self.session)
+
+    @cached_property
+    def invitations(self) -> InvitationRepository:
+        return InvitationRepository(session=self.session)
+
+    @cached_property
+    def notifications(self) -> NotificationRepository:
+        return NotificationRepository(session=self.session)
+
+    @cached_property
+    def quiz_answer(self) -> QuizAnswerRepository:
+        return QuizAnswerRepository(session=self.session)
+
+    @cached_property
+    def quiz_attempt(self) -> QuizAttemptRepository:
+        return QuizAttemptRepository(session=self.session)
+
+    @cached_property
+    def quiz_question(self) -> QuizQuestionRepository:
+        return QuizQuestionRepository(session=self.session)
+
+    @cached_property
+    def quiz_user_answer(self) -> QuizUserAnswerRepository:
+        return QuizUserAnswerRepository(session=self.session)
+
+    @cached_property
+    def quiz(self) -> QuizRepository:
+        return QuizRepository(session=self.session)
+
+    @cached_property
+    def requests(self) -> RequestRepository:
+        return RequestRepository(session=self.session)
+
+    @cached_property
+    def users(self) -> UserRepository:
+        return UserRepository(session=self.session)
@@ -1,7 +1,9 @@
 """WebSocket connection manager for real-time notifications."""
 
-from typing import Dict, Set
+import asyncio
+from typing import Dict, Optional
 
+import orjson
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
@@ -16,8 +18,8 @@ class WebSocketManager:
     """
 
     def __init__(self) -> None:
-        # user_id → set of WebSocket connections
-        self.active_connections: Dict[int, Set[WebSocket]] = {}
+        # user_id → {id(websocket): websocket}; identity keys, insertion order
+        self.active_connections: Dict[int, Dict[int, WebSocket]] = {}
 
     async def connect(self, user_id: int, websocket: WebSocket) -> None:
         """
@@ -25,10 +27,7 @@ class WebSocketManager:
         """
         await websocket.accept()
 
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = set()
-
-        self.active_connections[user_id].add(websocket)
+        self.active_connections.setdefault(user_id, {})[id(websocket)] = websocket
 
         logger.info(
             "WebSocket connected: user_id=%s, total_connections=%s",
@@ -45,7 +44,7 @@ class WebSocketManager:
         if not connections:
             return
 
-        connections.discard(websocket)
+        connections.pop(id(websocket), None)
 
         if not connections:
             del self.active_connections[user_id]
@@ -53,12 +52,17 @@ class WebSocketManager:
         logger.info(
             "WebSocket disconnected: user_id=%s, remaining_connections=%s",
             user_id,
-            len(self.active_connections.get(user_id, set())),
+            len(self.active_connections.get(user_id, {})),
         )
 
-    async def send_personal(self, user_id: int, message: dict) -> int:
+    async def send_personal(
+        self, user_id: int, message: dict, payload: Optional[str] = None
+    ) -> int:
         """
         Send message to all active connections of a specific user.
+
+        The message is JSON-encoded once (or taken pre-encoded from payload)
+        and the same text frame is written to every connection.
         """
         connections = self.active_connections.get(user_id)
 
@@ -69,21 +73,27 @@ class WebSocketManager:
         sent_count = 0
         dead_connections: list[WebSocket] = []
 
+        if payload is None:
+            payload = orjson.dumps(message).decode()
+
         # IMPORTANT: iterate over a copy
-        for connection in list(connections):
-            try:
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_json(message)
-                    sent_count += 1
-                else:
-                    dead_connections.append(connection)
-            except Exception as e:
+        targets = list(connections.values())
+        results = await asyncio.gather(
+            *(self._send(connection, payload) for connection in targets),
+            return_exceptions=True,
+        )
+
+        for connection, result in zip(targets, results):
+            if result is True:
+                sent_count += 1
+                continue
+            if isinstance(result, Exception):
                 logger.warning(
                     "WebSocket send failed: user_id=%s, error=%s",
                     user_id,
-                    e,
+                    result,
                 )
-                dead_connections.append(connection)
+            dead_connections.append(connection)
 
         for connection in dead_connections:
             self.disconnect(user_id, connection)
@@ -100,21 +110,37 @@ class WebSocketManager:
     async def broadcast(self, message: dict) -> int:
         """
         Broadcast message to all connected users.
-        """
-        total_sent = 0
 
-        for user_id in list(self.active_connections.keys()):
-            total_sent += await self.send_personal(user_id, message)
+        Sends to all users run concurrently, so one slow client does not
+        delay the rest.
+        """
+        payload = orjson.dumps(message).decode()
+        results = await asyncio.gather(
+            *(
+                self.send_personal(user_id, message, payload)
+                for user_id in list(self.active_connections.keys())
+            ),
+            return_exceptions=True,
+        )
+        total_sent = sum(result for result in results if isinstance(result, int))
 
         logger.info("WebSocket broadcast sent to %s connections", total_sent)
 
         return total_sent
 
+    @staticmethod
+    async def _send(connection: WebSocket, payload: str) -> bool:
+        """Send to one connection; False if it is no longer connected."""
+        if connection.client_state != WebSocketState.CONNECTED:
+            return False
+        await connection.send_text(payload)
+        return True
+
     def get_connection_count(self, user_id: int) -> int:
         """
         Get number of active connections for a user.
         """
-        return len(self.active_connections.get(user_id, set()))
+        return len(self.active_connections.get(user_id, {}))
 
     def get_total_connections(self) -> int:
         """
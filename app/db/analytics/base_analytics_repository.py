@@ -1,4 +1,6 @@
-from sqlalchemy import case, func, select
+from datetime import date, timedelta
+
+from sqlalchemy import Float, Integer, and_, cast, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -14,14 +16,72 @@ class BaseAnalyticsRepository:
     @staticmethod
     def avg_correct_case(column):
         """
-        AVG(CASE WHEN column IS TRUE THEN 1 ELSE 0 END)
+        Share of true values in a group:
+        SUM(column::int)::float / NULLIF(COUNT(*), 0)
+
+        Integer sum instead of AVG over a CASE: no per-row branch, and the
+        result is double precision rather than numeric.
+        """
+        correct = cast(func.sum(cast(column, Integer)), Float)
+        return correct / func.nullif(func.count(), 0)
+
+    @staticmethod
+    def on_dates(column, from_date: date, to_date: date):
+        """
+        column falls on a day in [from_date, to_date] (both inclusive).
+
+        Equivalent to DATE(column) BETWEEN from_date AND to_date, but written
+        as a half-open range on the bare column so a btree index on it can
+        be used.
         """
-        return func.avg(case((column.is_(True), 1), else_=0))
+        return and_(column >= from_date, column < to_date + timedelta(days=1))
 
-    async def count_from_subquery(self, stmt) -> int:
+    async def count_groups(self, stmt, group_key) -> int:
         """
-        Count total rows for a grouped query using subquery.
+        Count the groups of a query grouped by group_key.
+
+        COUNT(DISTINCT group_key) over the same joins and filters, so the
+        planner does not build every group and evaluate its aggregates
+        (as a count over the grouped subquery would) just to count them.
         """
-        count_stmt = select(func.count()).select_from(stmt.subquery())
+        count_stmt = (
+            stmt.with_only_columns(
+                func.count(group_key.distinct()), maintain_column_froms=True
+            )
+            .group_by(None)
+            .order_by(None)
+        )
         result = await self.session.execute(count_stmt)
         return result.scalar_one()
+
+    async def fetch_page(self, stmt, group_key, skip: int, limit: int, seek=None):
+        """
+        Fetch one page of a grouped query together with its total row count.
+
+        For OFFSET pages the total comes from COUNT(*) OVER () in the same
+        SELECT: the window is evaluated after GROUP BY and before LIMIT, so
+        every row carries the full group count and no second aggregation
+        round trip is needed. A separate count is only issued when the page
+        is empty past the first one (no row to read the total from).
+
+        With a `seek` predicate (keyset pagination) the window would only
+        count rows after the cursor, so the total is counted separately.
+        Separate counts use count_groups on `group_key`, the column that
+        identifies one group (one result row) of `stmt`.
+        """
+        if seek is not None:
+            total = await self.count_groups(stmt, group_key)
+            page = stmt.where(seek).limit(limit)
+            return (await self.session.execute(page)).all(), total
+
+        page = (
+            stmt.add_columns(func.count().over().label("total_count"))
+            .offset(skip)
+            .limit(limit)
+        )
+        items = (await self.session.execute(page)).all()
+        if items:
+            return items, items[0].total_count
+        if skip == 0:
+            return items, 0
+        return items, await self.count_groups(stmt, group_key)
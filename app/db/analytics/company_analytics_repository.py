@@ -1,7 +1,7 @@
 from datetime import date
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 
 from app.db.analytics.base_analytics_repository import BaseAnalyticsRepository
 from app.models import Quiz, QuizAttempt, QuizUserAnswer, User
@@ -19,9 +19,13 @@ class CompanyAnalyticsRepository(BaseAnalyticsRepository):
         to_date: date,
         skip: int,
         limit: int,
+        after: tuple | None = None,
     ) -> tuple[list, int]:
         """
         Paginated average scores for all users in a company within date range.
+
+        `after` is the (user_id,) key of the last row already returned;
+        when given, the page starts right after it instead of at `skip`.
         """
 
         base_query = (
@@ -37,18 +41,15 @@ class CompanyAnalyticsRepository(BaseAnalyticsRepository):
             .where(
                 Quiz.company_id == company_id,
                 QuizAttempt.completed_at.isnot(None),
-                func.date(QuizAttempt.completed_at).between(from_date, to_date),
+                self.on_dates(QuizAttempt.completed_at, from_date, to_date),
             )
             .group_by(QuizAttempt.user_id)
             .order_by(QuizAttempt.user_id)
         )
 
-        total = await self.count_from_subquery(base_query)
-
-        stmt = base_query.offset(skip).limit(limit)
-        items = (await self.session.execute(stmt)).all()
+        seek = QuizAttempt.user_id > after[0] if after is not None else None
 
-        return items, total
+        return await self.fetch_page(base_query, QuizAttempt.user_id, skip, limit, seek)
 
     async def get_company_user_quiz_averages_paginated(
         self,
@@ -58,10 +59,14 @@ class CompanyAnalyticsRepository(BaseAnalyticsRepository):
         to_date: date,
         skip: int,
         limit: int,
+        after: tuple | None = None,
     ) -> tuple[list, int]:
         """
         Paginated average scores per quiz for a selected user in a company
         within date range.
+
+        `after` is the (quiz_title, quiz_id) key of the last row already
+        returned; when given, the page starts right after it.
         """
 
         base_query = (
@@ -82,18 +87,17 @@ class CompanyAnalyticsRepository(BaseAnalyticsRepository):
                 Quiz.company_id == company_id,
                 QuizAttempt.user_id == target_user_id,
                 QuizAttempt.completed_at.isnot(None),
-                func.date(QuizAttempt.completed_at).between(from_date, to_date),
+                self.on_dates(QuizAttempt.completed_at, from_date, to_date),
             )
             .group_by(Quiz.id, Quiz.title)
-            .order_by(Quiz.title)
+            .order_by(Quiz.title, Quiz.id)
         )
 
-        total = await self.count_from_subquery(base_query)
+        seek = None
+        if after is not None:
+            seek = tuple_(Quiz.title, Quiz.id) > tuple_(*after)
 
-        stmt = base_query.offset(skip).limit(limit)
-        items = (await self.session.execute(stmt)).all()
-
-        return items, total
+        return await self.fetch_page(base_query, Quiz.id, skip, limit, seek)
 
     async def get_company_users_last_attempts_paginated(
         self,
@@ -118,9 +122,4 @@ class CompanyAnalyticsRepository(BaseAnalyticsRepository):
             .order_by(func.max(QuizAttempt.completed_at).desc())
         )
 
-        total = await self.count_from_subquery(base_query)
-
-        stmt = base_query.offset(skip).limit(limit)
-        items = (await self.session.execute(stmt)).all()
-
-        return items, total
+        return await self.fetch_page(base_query, QuizAttempt.user_id, skip, limit)
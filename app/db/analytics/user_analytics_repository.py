@@ -1,7 +1,7 @@
 from datetime import date
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 
 from app.db.analytics.base_analytics_repository import BaseAnalyticsRepository
 from app.models import Quiz, QuizAttempt, QuizUserAnswer
@@ -45,9 +45,13 @@ class UserAnalyticsRepository(BaseAnalyticsRepository):
         to_date: date,
         skip: int,
         limit: int,
+        after: tuple | None = None,
     ) -> tuple[list[Any], int]:
         """
         Paginated average score per quiz for a user.
+
+        `after` is the (quiz_title, quiz_id) key of the last row already
+        returned; when given, the page starts right after it.
         """
         base_query = (
             select(
@@ -65,15 +69,14 @@ class UserAnalyticsRepository(BaseAnalyticsRepository):
                 QuizUserAnswer.answered_at.between(from_date, to_date),
             )
             .group_by(Quiz.id, Quiz.title)
-            .order_by(Quiz.title)
+            .order_by(Quiz.title, Quiz.id)
         )
 
-        total = await self.count_from_subquery(base_query)
-
-        stmt = base_query.offset(skip).limit(limit)
-        items = (await self.session.execute(stmt)).all()
+        seek = None
+        if after is not None:
+            seek = tuple_(Quiz.title, Quiz.id) > tuple_(*after)
 
-        return items, total
+        return await self.fetch_page(base_query, Quiz.id, skip, limit, seek)
 
     async def get_user_last_quiz_completions_paginated(
         self,
@@ -96,9 +99,4 @@ class UserAnalyticsRepository(BaseAnalyticsRepository):
             .order_by(func.max(QuizAttempt.completed_at).desc())
         )
 
-        total = await self.count_from_subquery(base_query)
-
-        stmt = base_query.offset(skip).limit(limit)
-        items = (await self.session.execute(stmt)).all()
-
-        return items, total
+        return await self.fetch_page(base_query, Quiz.id, skip, limit)
@@ -2,10 +2,10 @@
 
 from typing import Generic, Optional, Type, TypeVar
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, func, literal, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Load
+from sqlalchemy.orm import InstrumentedAttribute, Load
 
 from app.core.logger import logger
 
@@ -19,10 +19,17 @@ class BaseRepository(Generic[T]):
         self.model = model
         self.session = session
 
-    async def get_one_by_id(self, id_: int) -> Optional[T]:
-        """Retrieve one record by Primary Key (ID)."""
+    async def get_one_by_id(
+        self, id_: int, options: list[Load] | None = None
+    ) -> Optional[T]:
+        """
+        Retrieve one record by Primary Key (ID), with optional eager-loading.
+
+        Without options an object already in the session is returned
+        without a query.
+        """
         try:
-            result = await self.session.get(self.model, id_)
+            result = await self.session.get(self.model, id_, options=options)
             return result
         except SQLAlchemyError as e:
             logger.error(f"Error getting {self.model.__name__} by id: {e}")
@@ -51,16 +58,36 @@ class BaseRepository(Generic[T]):
             raise
 
     async def create_one(self, obj: T) -> T:
-        """Create a new record."""
+        """
+        Create a new record.
+
+        No refresh after the flush: the primary key and server-side defaults
+        come back from INSERT ... RETURNING, so a follow-up SELECT is not
+        needed.
+        """
         try:
             self.session.add(obj)
             await self.session.flush()
-            await self.session.refresh(obj)
             return obj
         except SQLAlchemyError as e:
             logger.error(f"Error creating {self.model.__name__}: {e}")
             raise
 
+    async def create_many(self, objs: list[T]) -> list[T]:
+        """
+        Create several records in one flush.
+
+        SQLAlchemy batches the INSERTs (multi-row VALUES with RETURNING where
+        the driver supports it) instead of one round trip per object.
+        """
+        try:
+            self.session.add_all(objs)
+            await self.session.flush()
+            return objs
+        except SQLAlchemyError as e:
+            logger.error(f"Error creating {self.model.__name__} batch: {e}")
+            raise
+
     async def update_one(self, obj: T) -> T:
         """Update an existing record."""
         try:
@@ -80,18 +107,24 @@ class BaseRepository(Generic[T]):
             logger.error(f"Error deleting {self.model.__name__}: {e}")
             raise
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> tuple[list[T], int]:
-        """Retrieve paginated records and total count."""
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        options: list[Load] | None = None,
+    ) -> tuple[list[T], int]:
+        """
+        Retrieve paginated records and total count,
+        with optional eager-loading options.
+
+        """
         try:
-            total_query = await self.session.execute(select(func.count(self.model.id)))
-            total = total_query.scalar_one()
+            stmt = select(self.model)
 
-            result = await self.session.execute(
-                select(self.model).offset(skip).limit(limit)
-            )
-            items = result.scalars().all()
+            if options:
+                stmt = stmt.options(*options)
 
-            return list(items), total
+            return await self._fetch_page(stmt, skip, limit)
         except SQLAlchemyError as e:
             logger.error(f"Error getting {self.model.__name__} list: {e}")
             raise
@@ -103,29 +136,44 @@ class BaseRepository(Generic[T]):
         limit: int = 100,
         order_by: list | None = None,
         options: list[Load] | None = None,
-    ) -> tuple[list[T], int]:
+        columns: list[InstrumentedAttribute] | None = None,
+        seek=None,
+    ) -> tuple[list[T] | list[Row], int]:
         """
         Retrieve many records with filtering, ordering, pagination,
         and optional eager-loading options.
 
+        With `columns`, only those columns are selected and plain rows are
+        returned instead of ORM instances: no unused columns are fetched and
+        no identity-map bookkeeping is done. Use it for read-only list views;
+        `options` does not apply to projections.
+
+        `seek` is a keyset predicate on the sort key (rows after the last one
+        already returned); with it the page starts there instead of at
+        OFFSET `skip`, while the total still covers all of `conditions`.
+
+        Pass selectinload() for collections and joinedload() for to-one
+        relationships the caller will touch: lazy loading is not available
+        on an AsyncSession and would otherwise cost one query per row.
+        joinedload() on a collection multiplies rows and breaks LIMIT and
+        the total, so keep collections on selectinload().
+
         """
         try:
-            total = await self.count_by_filters(*conditions)
+            if columns:
+                stmt = select(*columns).where(*conditions)
+            else:
+                stmt = select(self.model).where(*conditions)
 
-            stmt = select(self.model).where(*conditions)
-
-            if options:
+            if options and not columns:
                 stmt = stmt.options(*options)
 
             if order_by:
                 stmt = stmt.order_by(*order_by)
 
-            stmt = stmt.offset(skip).limit(limit)
-
-            rows = await self.session.execute(stmt)
-            items = rows.scalars().all()
-
-            return list(items), total
+            return await self._fetch_page(
+                stmt, skip, limit, entities=not columns, seek=seek
+            )
         except SQLAlchemyError as e:
             condition_info = [str(c) for c in conditions]
             logger.error(
@@ -134,6 +182,45 @@ class BaseRepository(Generic[T]):
             )
             raise
 
+    async def _fetch_page(
+        self, stmt, skip: int, limit: int, entities: bool = True, seek=None
+    ) -> tuple[list[T] | list[Row], int]:
+        """
+        Run a paginated entity SELECT and get the total in the same round trip.
+
+        COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so each returned
+        row carries the total number of matching rows. Only a page past the
+        end (no rows, skip > 0) needs a separate COUNT query.
+
+        With a `seek` predicate the window would only count rows after the
+        cursor, so the total is counted separately and the page is read
+        with WHERE seek LIMIT instead of OFFSET.
+        """
+        if seek is not None:
+            total = await self._count(stmt)
+            result = await self.session.execute(stmt.where(seek).limit(limit))
+            return (list(result.scalars()) if entities else result.all()), total
+
+        total_col = func.count().over().label("total_count")
+        rows = (
+            await self.session.execute(
+                stmt.add_columns(total_col).offset(skip).limit(limit)
+            )
+        ).all()
+
+        if rows:
+            items = [row[0] for row in rows] if entities else rows
+            return items, rows[0].total_count
+        if skip == 0:
+            return [], 0
+
+        return [], await self._count(stmt)
+
+    async def _count(self, stmt) -> int:
+        """Count the rows a SELECT would return, ignoring its ORDER BY."""
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return (await self.session.execute(count_stmt)).scalar_one()
+
     async def delete_by_filters(self, *conditions) -> int:
         """
         Delete records matching conditions (bulk delete).
@@ -150,6 +237,22 @@ class BaseRepository(Generic[T]):
             logger.error(f"Error deleting {self.model.__name__} by filters: {e}")
             raise
 
+    async def exists_by_filters(self, *conditions) -> bool:
+        """
+        Check whether any record matches the conditions.
+
+        SELECT 1 ... LIMIT 1: stops at the first match instead of counting
+        or loading it. Prefer this over count_by_filters()/get_one_by_filters()
+        for "has any" checks.
+        """
+        try:
+            stmt = select(literal(1)).select_from(self.model).where(*conditions)
+            result = await self.session.execute(stmt.limit(1))
+            return result.first() is not None
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking {self.model.__name__} existence: {e}")
+            raise
+
     async def count_by_filters(self, *conditions) -> int:
         """
         Count records matching given conditions.
@@ -64,3 +64,12 @@ class BaseRelationRepository(BaseRepository[T]):
         ]
 
         return await self.get_one_by_filters(*conditions)
+
+    async def has_pending_by_company_and_user(
+        self, company_id: int, user_id: int
+    ) -> bool:
+        return await self.exists_by_filters(
+            self.model.company_id == company_id,
+            self.model.user_id == user_id,
+            self.model.status == Status.PENDING,
+        )
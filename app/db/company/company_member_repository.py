@@ -50,6 +50,15 @@ class CompanyMemberRepository(BaseRepository[CompanyMember]):
 
         return await self.get_one_by_filters(*conditions)
 
+    async def is_member(self, company_id: int, user_id: int) -> bool:
+        """
+        Check whether user is a member of the company (without loading it).
+        """
+        return await self.exists_by_filters(
+            CompanyMember.company_id == company_id,
+            CompanyMember.user_id == user_id,
+        )
+
     async def get_member_role(self, company_id: int, user_id: int) -> str | None:
         """
         Get user's role in the company.
@@ -1,4 +1,6 @@
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Load
 
 from app.db.base.base_repository import BaseRepository
 from app.models import Company
@@ -7,31 +9,60 @@ from app.models import Company
 class CompanyRepository(BaseRepository[Company]):
     """Repository for Company model with custom methods."""
 
+    # Columns rendered by CompanyResponse in list views
+    _list_columns = [
+        Company.id,
+        Company.name,
+        Company.description,
+        Company.is_visible,
+        Company.owner_id,
+        Company.created_at,
+        Company.updated_at,
+    ]
+
     def __init__(self, session: AsyncSession):
         super().__init__(model=Company, session=session)
 
     async def get_by_owner(
-        self, owner_id: int, skip: int = 0, limit: int = 10
+        self,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        options: list[Load] | None = None,
     ) -> tuple[list[Company], int]:
         """
         Get all companies owned by a specific user (paginated).
+        Pass e.g. options=[selectinload(Company.members)] when members are needed.
         """
         conditions = [Company.owner_id == owner_id]
         order = [Company.created_at.desc()]
 
         return await self.get_many_by_filters(
-            *conditions, skip=skip, limit=limit, order_by=order
+            *conditions, skip=skip, limit=limit, order_by=order, options=options
         )
 
     async def get_visible_companies(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Company], int]:
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        options: list[Load] | None = None,
+    ) -> tuple[list[Company] | list[Row], int]:
         """
         Get all visible companies (paginated).
+
+        Public list view: returns rows with only the columns CompanyResponse
+        needs rather than Company instances (unless eager-loading options
+        are requested).
         """
         conditions = [Company.is_visible.is_(True)]
         order = [Company.created_at.desc()]
+        columns = None if options else self._list_columns
 
         return await self.get_many_by_filters(
-            *conditions, skip=skip, limit=limit, order_by=order
+            *conditions,
+            skip=skip,
+            limit=limit,
+            order_by=order,
+            options=options,
+            columns=columns,
         )
@@ -1,6 +1,6 @@
-from typing import List
+from datetime import datetime
 
-from sqlalchemy import update
+from sqlalchemy import tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base.base_repository import BaseRepository
@@ -20,7 +20,8 @@ class NotificationRepository(BaseRepository[Notification]):
         skip: int = 0,
         limit: int = 100,
         unread_only: bool = False,
-    ) -> tuple[List[Notification], int]:
+        after: tuple[datetime, int] | None = None,
+    ) -> tuple[list[Notification], int]:
         """Get notifications for a specific user with pagination.
 
         Args:
@@ -28,6 +29,9 @@ class NotificationRepository(BaseRepository[Notification]):
             skip: Number of records to skip (offset)
             limit: Maximum number of records to return
             unread_only: If True, return only unread notifications
+            after: (created_at, id) of the last notification already
+                returned; when given, the page starts right after it and
+                skip is ignored
 
         Returns:
             Tuple of (list of notifications, total count)
@@ -37,11 +41,16 @@ class NotificationRepository(BaseRepository[Notification]):
         if unread_only:
             conditions.append(Notification.status == NotificationStatus.UNREAD)
 
+        seek = None
+        if after is not None:
+            seek = tuple_(Notification.created_at, Notification.id) < tuple_(*after)
+
         return await self.get_many_by_filters(
             *conditions,
             skip=skip,
             limit=limit,
-            order_by=[Notification.created_at.desc()],
+            order_by=[Notification.created_at.desc(), Notification.id.desc()],
+            seek=seek,
         )
 
     async def mark_as_read(
@@ -68,14 +77,10 @@ class NotificationRepository(BaseRepository[Notification]):
             .returning(Notification)
         )
 
+        # RETURNING already carries every column, and the default
+        # synchronize_session updates a copy already in the session
         result = await self.session.execute(stmt)
-        await self.session.flush()
-
-        notification = result.scalar_one_or_none()
-        if notification:
-            await self.session.refresh(notification)
-
-        return notification
+        return result.scalar_one_or_none()
 
     async def mark_all_as_read(self, user_id: int) -> int:
         """
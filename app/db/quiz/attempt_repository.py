@@ -1,37 +1,73 @@
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, NamedTuple, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.db.base.base_repository import BaseRepository
-from app.models import QuizAttempt
+from app.models import Company, Quiz, QuizAttempt, QuizUserAnswer
 from app.models.company.company_member import CompanyMember
 
+EXPORT_BATCH_SIZE = 5_000
 MAX_EXPORT_LIMIT = 1_000_000
 
 
+class UserAttemptStats(NamedTuple):
+    """Aggregates over a user's completed attempts."""
+
+    total_score: int | None
+    total_questions: int | None
+    attempt_count: int
+    last_completed_at: datetime | None
+
+    @property
+    def average(self) -> Optional[float]:
+        """SUM(score) / SUM(total_questions) * 100, or None without data."""
+        if self.total_score is None or not self.total_questions:
+            return None
+        return (self.total_score / self.total_questions) * 100.0
+
+
 class QuizAttemptRepository(BaseRepository[QuizAttempt]):
     """Repository for QuizAttempt model with analytics operations."""
 
     def __init__(self, session: AsyncSession):
         super().__init__(model=QuizAttempt, session=session)
 
+    @staticmethod
+    def _brief_relations() -> list:
+        """
+        Load quiz and company with only the columns attempt responses
+        render (QuizBriefResponse / CompanyBriefResponse).
+        """
+        return [
+            selectinload(QuizAttempt.quiz).load_only(Quiz.id, Quiz.title),
+            selectinload(QuizAttempt.company).load_only(Company.id, Company.name),
+        ]
+
     async def create_attempt(
         self,
         user_id: int,
         quiz_id: int,
         company_id: int,
         total_questions: int,
+        score: int = 0,
+        completed_at: Optional[datetime] = None,
     ) -> QuizAttempt:
-        """Create a new quiz attempt."""
+        """
+        Create a new quiz attempt.
+
+        Pass score and completed_at when they are already known to insert a
+        finished attempt in one statement.
+        """
         attempt = QuizAttempt(
             user_id=user_id,
             quiz_id=quiz_id,
             company_id=company_id,
             total_questions=total_questions,
-            score=0,  # Will be calculated after answers
+            score=score,
+            completed_at=completed_at,
         )
         return await self.create_one(attempt)
 
@@ -60,32 +96,45 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
             skip=skip,
             limit=limit,
             order_by=[QuizAttempt.completed_at.desc()],
-            options=[
-                selectinload(QuizAttempt.quiz),
-                selectinload(QuizAttempt.company),
-            ],
+            options=self._brief_relations(),
         )
 
-    async def calculate_user_global_average(self, user_id: int) -> Optional[float]:
+    async def get_user_stats(
+        self,
+        user_id: int,
+        company_id: Optional[int] = None,
+    ) -> UserAttemptStats:
         """
-        Calculate user's global average across all completed quizzes.
-        Formula: SUM(score) / SUM(total_questions) * 100
+        Score totals, attempt count and last completion for a user's
+        completed attempts (optionally within one company).
+
+        All four aggregates come from a single pass over the attempts in
+        one query.
         """
-        stmt = select(
-            func.sum(QuizAttempt.score).label("total_score"),
-            func.sum(QuizAttempt.total_questions).label("total_questions"),
-        ).where(
+        filters = [
             QuizAttempt.user_id == user_id,
             QuizAttempt.completed_at.isnot(None),
-        )
+        ]
 
-        result = await self.session.execute(stmt)
-        row = result.one_or_none()
+        if company_id is not None:
+            filters.append(QuizAttempt.company_id == company_id)
 
-        if not row or row.total_score is None or row.total_questions == 0:
-            return None
+        stmt = select(
+            func.sum(QuizAttempt.score),
+            func.sum(QuizAttempt.total_questions),
+            func.count(),
+            func.max(QuizAttempt.completed_at),
+        ).where(*filters)
 
-        return (row.total_score / row.total_questions) * 100.0
+        result = await self.session.execute(stmt)
+        return UserAttemptStats(*result.one())
+
+    async def calculate_user_global_average(self, user_id: int) -> Optional[float]:
+        """
+        Calculate user's global average across all completed quizzes.
+        Formula: SUM(score) / SUM(total_questions) * 100
+        """
+        return (await self.get_user_stats(user_id)).average
 
     async def calculate_user_company_average(
         self, user_id: int, company_id: int
@@ -94,22 +143,7 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
         Calculate user's average for a specific company.
         Formula: SUM(score) / SUM(total_questions) * 100
         """
-        stmt = select(
-            func.sum(QuizAttempt.score).label("total_score"),
-            func.sum(QuizAttempt.total_questions).label("total_questions"),
-        ).where(
-            QuizAttempt.user_id == user_id,
-            QuizAttempt.company_id == company_id,
-            QuizAttempt.completed_at.isnot(None),
-        )
-
-        result = await self.session.execute(stmt)
-        row = result.one_or_none()
-
-        if not row or row.total_score is None or row.total_questions == 0:
-            return None
-
-        return (row.total_score / row.total_questions) * 100.0
+        return (await self.get_user_stats(user_id, company_id)).average
 
     async def count_user_completed_attempts(
         self,
@@ -117,38 +151,29 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
         company_id: Optional[int] = None,
     ) -> int:
         """Count total completed quiz attempts for a user."""
-        filters = [
-            QuizAttempt.user_id == user_id,
-            QuizAttempt.completed_at.isnot(None),
-        ]
-
-        if company_id is not None:
-            filters.append(QuizAttempt.company_id == company_id)
-
-        return await self.count_by_filters(*filters)
+        return (await self.get_user_stats(user_id, company_id)).attempt_count
 
     async def get_user_last_attempt(self, user_id: int) -> Optional[datetime]:
-        """Get the timestamp of user's last completed attempt (any quiz)."""
-        stmt = (
-            select(QuizAttempt.completed_at)
-            .where(
-                QuizAttempt.user_id == user_id,
-                QuizAttempt.completed_at.isnot(None),
-            )
-            .order_by(QuizAttempt.completed_at.desc())
-            .limit(1)
+        """
+        Get the timestamp of user's last completed attempt (any quiz).
+
+        MAX() rather than ORDER BY ... LIMIT 1: no sort, and the planner can
+        read it off the end of idx_user_completed.
+        """
+        stmt = select(func.max(QuizAttempt.completed_at)).where(
+            QuizAttempt.user_id == user_id,
+            QuizAttempt.completed_at.isnot(None),
         )
 
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.scalar()
 
     async def get_with_details(self, attempt_id: int) -> Optional[QuizAttempt]:
         """Get attempt with all related data (quiz, company, user_answers)."""
         return await self.get_one_by_filters(
             QuizAttempt.id == attempt_id,
             options=[
-                selectinload(QuizAttempt.quiz),
-                selectinload(QuizAttempt.company),
+                *self._brief_relations(),
                 selectinload(QuizAttempt.user_answers),
             ],
         )
@@ -186,7 +211,16 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
         user_id: int | None = None,
         company_id: int | None = None,
         quiz_id: int | None = None,
-    ) -> list[QuizAttempt]:
+    ) -> AsyncIterator[Row]:
+        """
+        Stream one row per answer of matching completed attempts.
+
+        Selects just the exported columns from quiz_attempts joined to
+        quiz_user_answers and reads them in EXPORT_BATCH_SIZE batches, so no
+        ORM instances, identity-map entries or selectin queries are created
+        for what can be a very large result. At most MAX_EXPORT_LIMIT of the
+        most recently completed attempts are exported.
+        """
         filters = [QuizAttempt.completed_at.isnot(None)]
 
         if user_id is not None:
@@ -198,16 +232,30 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
         if quiz_id is not None:
             filters.append(QuizAttempt.quiz_id == quiz_id)
 
-        attempts, _ = await self.get_many_by_filters(
-            *filters,
-            skip=0,
-            limit=MAX_EXPORT_LIMIT,
-            order_by=[QuizAttempt.completed_at.desc()],
-            options=[
-                selectinload(QuizAttempt.user_answers),
-                selectinload(QuizAttempt.quiz),
-                selectinload(QuizAttempt.company),
-            ],
+        latest_attempts = (
+            select(QuizAttempt.id)
+            .where(*filters)
+            .order_by(QuizAttempt.completed_at.desc())
+            .limit(MAX_EXPORT_LIMIT)
+        )
+
+        stmt = (
+            select(
+                QuizAttempt.user_id,
+                QuizAttempt.company_id,
+                QuizAttempt.quiz_id,
+                QuizAttempt.id.label("attempt_id"),
+                QuizUserAnswer.question_id,
+                QuizUserAnswer.answer_id,
+                QuizUserAnswer.is_correct,
+                QuizUserAnswer.answered_at,
+            )
+            .join(QuizUserAnswer, QuizUserAnswer.attempt_id == QuizAttempt.id)
+            .where(QuizAttempt.id.in_(latest_attempts))
+            .order_by(QuizAttempt.completed_at.desc(), QuizUserAnswer.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
         )
 
-        return attempts
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield row
@@ -1,10 +1,21 @@
 from typing import Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, with_expression
 
 from app.db.base.base_repository import BaseRepository
-from app.models import Quiz, QuizQuestion
+from app.models import Quiz, QuizAttempt, QuizQuestion
+
+# Attempts per quiz as a correlated subquery, so quiz views get one number
+# per row instead of loading every attempt to count it.
+_participation_count = with_expression(
+    Quiz.participation_count,
+    select(func.count(QuizAttempt.id))
+    .where(QuizAttempt.quiz_id == Quiz.id)
+    .correlate(Quiz)
+    .scalar_subquery(),
+)
 
 
 class QuizRepository(BaseRepository[Quiz]):
@@ -23,21 +34,30 @@ class QuizRepository(BaseRepository[Quiz]):
             skip=skip,
             limit=limit,
             order_by=[Quiz.created_at.desc()],
-            options=[selectinload(Quiz.attempts)],
+            options=[_participation_count],
         )
 
     async def get_with_relations(self, quiz_id: int) -> Optional[Quiz]:
-        """Retrieve quiz with all relations eagerly loaded (questions + answers)."""
+        """
+        Retrieve quiz with all relations eagerly loaded (questions + answers).
 
-        return await self.get_one_by_filters(
-            Quiz.id == quiz_id,
-            options=[
-                selectinload(Quiz.questions).selectinload(QuizQuestion.answers),
-                selectinload(Quiz.attempts),
-                selectinload(Quiz.company),
-            ],
+        Joined eager loading fetches the quiz, its questions, their answers
+        and the company in one round trip instead of one SELECT per level.
+        The row fan-out (questions x answers) is small for a single quiz.
+        """
+        stmt = (
+            select(Quiz)
+            .where(Quiz.id == quiz_id)
+            .options(
+                joinedload(Quiz.questions).joinedload(QuizQuestion.answers),
+                joinedload(Quiz.company),
+                _participation_count,
+            )
         )
 
+        result = await self.session.execute(stmt)
+        return result.unique().scalar_one_or_none()
+
     async def get_by_title_and_company(
         self, title: str, company_id: int
     ) -> Optional[Quiz]:
@@ -1,8 +1,15 @@
+from sqlalchemy import Row, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base.base_repository import BaseRepository
 from app.models import QuizUserAnswer
 
+# Built once and reused for every submission; executed with a list of dicts
+# it becomes one batched INSERT ... RETURNING.
+_INSERT_USER_ANSWERS = insert(QuizUserAnswer).returning(
+    QuizUserAnswer.id, QuizUserAnswer.is_correct
+)
+
 
 class QuizUserAnswerRepository(BaseRepository[QuizUserAnswer]):
     """Repository for QuizUserAnswer model."""
@@ -13,30 +20,25 @@ class QuizUserAnswerRepository(BaseRepository[QuizUserAnswer]):
     async def bulk_create_answers(
         self,
         answers_data: list[dict],
-    ) -> list[QuizUserAnswer]:
+    ) -> list[Row]:
         """
         Bulk create multiple user answers.
 
+        One INSERT ... RETURNING for the whole batch, without building ORM
+        instances or identity-map entries for the new rows.
+
         Args:
             answers_data: List of dicts with keys:
                 attempt_id, question_id, answer_id, is_correct
 
         Returns:
-            List of created QuizUserAnswer objects
+            Rows of (id, is_correct) for the created answers
         """
-        user_answers = [
-            QuizUserAnswer(
-                attempt_id=data["attempt_id"],
-                question_id=data["question_id"],
-                answer_id=data["answer_id"],
-                is_correct=data["is_correct"],
-            )
-            for data in answers_data
-        ]
-
-        self.session.add_all(user_answers)
-        await self.session.flush()
-
-        return user_answers
+        if not answers_data:
+            return []
+
+        result = await self.session.execute(_INSERT_USER_ANSWERS, answers_data)
+
+        return list(result.all())
 
     #     )
@@ -1,5 +1,8 @@
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.logger import logger
 from app.db.base.base_repository import BaseRepository
 from app.models import User
 
@@ -11,5 +14,17 @@ class UserRepository(BaseRepository[User]):
         super().__init__(model=User, session=session)
 
     async def get_by_email(self, email: str) -> User | None:
-        """Find a user by email."""
-        return await self.get_one_by_filters(User.email == email)
+        """
+        Find a user by email.
+
+        Runs on every Auth0-authenticated request, so it is a lambda_stmt:
+        the statement and its cache key are built once per process instead
+        of on every call, and `email` is bound as a parameter.
+        """
+        try:
+            stmt = lambda_stmt(lambda: select(User).where(User.email == email).limit(1))
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting User by email: {e}")
+            raise
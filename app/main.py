@@ -1,3 +1,5 @@
+import asyncio
+import importlib.util
 from contextlib import asynccontextmanager
 from zoneinfo import ZoneInfo
 
@@ -6,19 +8,36 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
+from app.core.auth0 import close_http_client, start_jwks_refresher, stop_jwks_refresher
+from app.core.database import close_db, warm_up_pool
 from app.core.logger import logger
+from app.core.redis import close_redis, get_redis
 from app.routers import router
+from app.services.notification.unread_count_cache import UnreadCountCache
 from app.services.scheduler.quiz_reminder_service import QuizReminderService
 
 _KYIV_TZ = ZoneInfo("Europe/Kyiv")
 
+# The API's actual CORS surface. Explicit values let CORSMiddleware check
+# preflights against fixed sets instead of echoing whatever was requested.
+# The CORS-safelisted headers (Accept, Content-Type, ...) are always allowed.
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_CORS_HEADERS = ("Authorization", "Content-Type", "X-Requested-With")
+
+# Quiz and attempt payloads are repetitive JSON that compresses well; below
+# ~1 KB the gzip framing costs more than it saves. Level 5 keeps CPU low.
+_GZIP_MINIMUM_SIZE = 1024
+_GZIP_COMPRESSLEVEL = 5
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     scheduler = AsyncIOScheduler()
-    reminder_service = QuizReminderService()
+    reminder_service = QuizReminderService(unread_cache=UnreadCountCache(get_redis()))
 
     scheduler.add_job(
         reminder_service.send_quiz_reminders,
@@ -30,25 +49,46 @@ async def lifespan(app: FastAPI):
     scheduler.start()
     logger.info("Scheduler started — quiz reminders will run daily at 22:00 Kyiv time")
 
+    if settings.auth0.AUTH0_DOMAIN:
+        start_jwks_refresher()
+
+    await warm_up_pool()
+
     yield
 
     scheduler.shutdown(wait=False)
     logger.info("Scheduler stopped")
 
+    # The refresher uses the HTTP client, so it stops first; the remaining
+    # teardowns are independent and one failing must not skip the others.
+    await stop_jwks_refresher()
+    results = await asyncio.gather(
+        close_http_client(), close_redis(), close_db(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Shutdown step failed: %s", result)
+
 
 _title = (
     settings.app.PROJECT_NAME
     if settings.app.ENV == "production"
     else f"[DEV] {settings.app.PROJECT_NAME}"
 )
-app = FastAPI(title=_title, lifespan=lifespan)
+app = FastAPI(title=_title, lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.app.get_cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
+)
+# Added last, so it wraps CORSMiddleware and compresses its responses too
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=_GZIP_MINIMUM_SIZE,
+    compresslevel=_GZIP_COMPRESSLEVEL,
 )
 
 app.include_router(router)
@@ -56,10 +96,21 @@ app.include_router(router)
 logger.info("Starting FastAPI application...")
 
 
+def _server_impl(module: str) -> str:
+    """
+    Pin uvloop / httptools when installed instead of relying on uvicorn's
+    autodetection; fall back to "auto" where they are unavailable (uvloop
+    has no Windows build).
+    """
+    return module if importlib.util.find_spec(module) else "auto"
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host=settings.app.HOST,
         port=settings.app.PORT,
         reload=settings.app.RELOAD,
+        loop=_server_impl("uvloop"),
+        http=_server_impl("httptools"),
     )
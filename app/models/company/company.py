@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -41,5 +41,15 @@ class Company(IDMixin, TimestampMixin, Base):
         back_populates="company", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Listings filter on owner / visibility and sort by created_at DESC
+        Index("idx_companies_owner_created", "owner_id", "created_at"),
+        Index(
+            "idx_companies_visible_created",
+            "created_at",
+            postgresql_where=text("is_visible"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Company(id={self.id}, name={self.name}, owner_id={self.owner_id})>"
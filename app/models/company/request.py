@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 
 from app.core.database import Base
@@ -18,6 +19,11 @@ class Request(IDMixin, TimestampMixin, InvitationRequestMixin, Base):
     """
 
     __tablename__ = "requests"
+    __table_args__ = (
+        # get_by_company / get_by_user sort by created_at DESC, status optional
+        Index("idx_requests_company_created", "company_id", "created_at"),
+        Index("idx_requests_user_created", "user_id", "created_at"),
+    )
 
     # Relationships
     company: Mapped["Company"] = relationship("Company", back_populates="requests")
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -28,6 +28,10 @@ class Notification(IDMixin, TimestampMixin, Base):
     """
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Feed order (created_at DESC, id DESC) per user, incl. keyset seeks
+        Index("idx_notifications_user_created", "user_id", "created_at", "id"),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.core.database import Base
 from app.models.base.mixins import IDMixin, TimestampMixin
@@ -16,6 +16,7 @@ class Quiz(IDMixin, TimestampMixin, Base):
     """
 
     __tablename__ = "quizzes"
+    __table_args__ = (Index("idx_quizzes_company_created", "company_id", "created_at"),)
 
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
@@ -35,14 +36,14 @@ class Quiz(IDMixin, TimestampMixin, Base):
         back_populates="quiz", cascade="all, delete-orphan"
     )
 
+    # Number of attempts, computed in SQL by the loading query
+    # (QuizRepository loads it with with_expression); None when not loaded.
+    participation_count: Mapped[int | None] = query_expression()
+
     @property
     def total_questions_count(self) -> int:
         return len(self.questions)
 
-    @property
-    def participation_count(self) -> int:
-        return len(self.attempts)
-
     def __repr__(self) -> str:
         return (
             f"<Quiz(id={self.id}, title='{self.title}', company_id={self.company_id})>"
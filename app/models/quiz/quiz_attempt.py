@@ -1,7 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -54,6 +54,14 @@ class QuizAttempt(IDMixin, TimestampMixin, Base):
         Index("idx_company_completed", "company_id", "completed_at"),
         Index("idx_quiz_completed", "quiz_id", "completed_at"),
         Index("idx_user_company_quiz", "user_id", "company_id", "quiz_id"),
+        # Analytics date-range scans over completed attempts only
+        Index(
+            "idx_completed_user_quiz",
+            "completed_at",
+            "user_id",
+            "quiz_id",
+            postgresql_where=text("completed_at IS NOT NULL"),
+        ),
     )
 
     @property
@@ -66,13 +74,6 @@ class QuizAttempt(IDMixin, TimestampMixin, Base):
     def is_completed(self) -> bool:
         return self.completed_at is not None
 
-    def calculate_score(self) -> int:
-        return sum(1 for ua in self.user_answers if ua.is_correct)
-
-    def mark_completed(self) -> None:
-        self.completed_at = datetime.now(timezone.utc)
-        self.score = self.calculate_score()
-
     def __repr__(self) -> str:
         return (
             f"<QuizAttempt(id={self.id}, user_id={self.user_id}, quiz_id={self.quiz_id}, "
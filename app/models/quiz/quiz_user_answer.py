@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -41,6 +41,12 @@ class QuizUserAnswer(IDMixin, TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("attempt_id", "question_id", name="uq_attempt_question"),
+        # Lets score aggregates read is_correct from the index (index-only scan)
+        Index(
+            "idx_user_answer_attempt_correct",
+            "attempt_id",
+            postgresql_include=["is_correct"],
+        ),
     )
 
     def __repr__(self) -> str:
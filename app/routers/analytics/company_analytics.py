@@ -9,7 +9,10 @@ from app.schemas.analytics.company_analytics import (
     CompanyUsersAveragesListResponse,
     CompanyUsersLastAttemptsListResponse,
 )
-from app.schemas.pagination.pagination import PaginationBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginationSchema,
+    PaginationBaseSchema,
+)
 from app.services.analytics.company_analytics_service import CompanyAnalyticsService
 
 router = APIRouter()
@@ -26,7 +29,7 @@ async def get_company_users_averages(
     company_id: int = Path(..., ge=1),
     from_date: date = Query(..., description="Start date (inclusive)"),
     to_date: date = Query(..., description="End date (inclusive)"),
-    pagination: PaginationBaseSchema = Depends(),
+    pagination: CursorPaginationSchema = Depends(),
     current_user: User = Depends(get_current_user),
     analytics_service: CompanyAnalyticsService = Depends(get_company_analytics_service),
 ) -> CompanyUsersAveragesListResponse:
@@ -54,7 +57,7 @@ async def get_company_user_quiz_averages(
     user_id: int = Path(..., ge=1),
     from_date: date = Query(..., description="Start date (inclusive)"),
     to_date: date = Query(..., description="End date (inclusive)"),
-    pagination: PaginationBaseSchema = Depends(),
+    pagination: CursorPaginationSchema = Depends(),
     current_user: User = Depends(get_current_user),
     analytics_service: CompanyAnalyticsService = Depends(get_company_analytics_service),
 ) -> CompanyUserQuizAveragesListResponse:
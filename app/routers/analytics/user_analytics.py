@@ -9,7 +9,10 @@ from app.schemas.analytics.user_analytics import (
     UserQuizAveragesListResponse,
     UserQuizLastCompletionListResponse,
 )
-from app.schemas.pagination.pagination import PaginationBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginationSchema,
+    PaginationBaseSchema,
+)
 from app.services.analytics.user_analytics_service import UserAnalyticsService
 
 router = APIRouter()
@@ -42,7 +45,7 @@ async def get_my_overall_rating(
 async def get_my_quiz_averages(
     from_date: date = Query(..., description="Start date (inclusive)"),
     to_date: date = Query(..., description="End date (inclusive)"),
-    pagination: PaginationBaseSchema = Depends(),
+    pagination: CursorPaginationSchema = Depends(),
     current_user: User = Depends(get_current_user),
     analytics_service: UserAnalyticsService = Depends(get_user_analytics_service),
 ) -> UserQuizAveragesListResponse:
@@ -5,7 +5,7 @@ from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
+from app.config import Settings, get_settings
 from app.core.database import get_raw_session
 from app.core.redis import get_redis
 
@@ -70,6 +70,7 @@ async def check_redis(redis: Redis = Depends(get_redis)):
 async def check_all(
     db: AsyncSession = Depends(get_raw_session),
     redis: Redis = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
 ):
     """
     Full Health Check
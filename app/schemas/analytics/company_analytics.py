@@ -2,7 +2,10 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.schemas.pagination.pagination import PaginatedResponseBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginatedResponseBaseSchema,
+    PaginatedResponseBaseSchema,
+)
 
 
 class AverageScoreResponse(BaseModel):
@@ -25,7 +28,7 @@ class AverageScoreResponse(BaseModel):
 
 
 class CompanyUsersAveragesListResponse(
-    PaginatedResponseBaseSchema[AverageScoreResponse]
+    CursorPaginatedResponseBaseSchema[AverageScoreResponse]
 ):
     """
     Paginated average scores for all users in a company within date range.
@@ -35,7 +38,7 @@ class CompanyUsersAveragesListResponse(
 
 
 class CompanyUserQuizAveragesListResponse(
-    PaginatedResponseBaseSchema[AverageScoreResponse]
+    CursorPaginatedResponseBaseSchema[AverageScoreResponse]
 ):
     """
     Paginated average scores per quiz for a selected user in a company within date range.
@@ -2,7 +2,10 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.schemas.pagination.pagination import PaginatedResponseBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginatedResponseBaseSchema,
+    PaginatedResponseBaseSchema,
+)
 
 
 class UserOverallRatingResponse(BaseModel):
@@ -30,7 +33,7 @@ class UserQuizAverageResponse(BaseModel):
 
 
 class UserQuizAveragesListResponse(
-    PaginatedResponseBaseSchema[UserQuizAverageResponse]
+    CursorPaginatedResponseBaseSchema[UserQuizAverageResponse]
 ):
     """
     Paginated list of quiz average scores for a user.
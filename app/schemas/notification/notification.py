@@ -4,8 +4,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from app.enums.notification_status import NotificationStatus
 from app.schemas.pagination.pagination import (
-    PaginatedResponseBaseSchema,
-    PaginationBaseSchema,
+    CursorPaginatedResponseBaseSchema,
+    CursorPaginationSchema,
 )
 
 
@@ -25,7 +25,7 @@ class NotificationResponse(NotificationBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class NotificationsPaginationRequest(PaginationBaseSchema):
+class NotificationsPaginationRequest(CursorPaginationSchema):
     """Pagination request for notifications list."""
 
     unread_only: bool = Field(
@@ -33,7 +33,9 @@ class NotificationsPaginationRequest(PaginationBaseSchema):
     )
 
 
-class NotificationsListResponse(PaginatedResponseBaseSchema[NotificationResponse]):
+class NotificationsListResponse(
+    CursorPaginatedResponseBaseSchema[NotificationResponse]
+):
     """Paginated response schema for list of notifications."""
 
     unread_count: int = Field(0, description="Number of unread notifications")
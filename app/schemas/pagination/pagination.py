@@ -18,3 +18,14 @@ class PaginatedResponseBaseSchema(BaseModel, Generic[T]):
     limit: int
     total_pages: int
     results: list[T]
+
+
+class CursorPaginationSchema(PaginationBaseSchema):
+    cursor: str | None = Field(
+        None,
+        description="Opaque next_cursor from the previous page (takes precedence over page)",
+    )
+
+
+class CursorPaginatedResponseBaseSchema(PaginatedResponseBaseSchema[T]):
+    next_cursor: str | None = None
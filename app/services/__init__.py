@@ -5,9 +5,11 @@ from .companies.member_service import MemberService
 from .companies.permission_service import PermissionService
 from .companies.request_service import RequestService
 from .notification.notification_service import NotificationService
+from .notification.unread_count_cache import UnreadCountCache
 from .quiz.quiz_attempt_service import QuizAttemptService
 from .quiz.quiz_redis_service import RedisQuizService
 from .quiz.quiz_service import QuizService
+from .quiz.user_stats_cache import UserStatsCache
 from .users.auth_service import AuthService
 from .users.user_service import UserService
 
@@ -24,4 +26,6 @@ __all__ = [
     "AuthService",
     "UserService",
     "RedisQuizService",
+    "UnreadCountCache",
+    "UserStatsCache",
 ]
@@ -10,9 +10,12 @@ from app.schemas.analytics.company_analytics import (
     CompanyUsersAveragesListResponse,
     CompanyUsersLastAttemptsListResponse,
 )
-from app.schemas.pagination.pagination import PaginationBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginationSchema,
+    PaginationBaseSchema,
+)
 from app.services.companies.admin_service import AdminService
-from app.utils.pagination import paginate_query
+from app.utils.pagination import paginate_keyset, paginate_query, parse_cursor_key
 
 
 class CompanyAnalyticsService:
@@ -34,7 +37,7 @@ class CompanyAnalyticsService:
         current_user_id: int,
         from_date: date,
         to_date: date,
-        pagination: PaginationBaseSchema,
+        pagination: CursorPaginationSchema,
     ) -> CompanyUsersAveragesListResponse:
         """
         Get paginated average scores for all users in a company within date range.
@@ -50,22 +53,28 @@ class CompanyAnalyticsService:
         async with self._uow:
             try:
 
-                async def db_fetch(skip: int, limit: int):
+                async def db_fetch(after: tuple | None, skip: int, limit: int):
+                    if after is not None:
+                        after = parse_cursor_key(after, int)
                     return await self._uow.company_analytic.get_company_users_averages_paginated(
                         company_id=company_id,
                         from_date=from_date,
                         to_date=to_date,
                         skip=skip,
                         limit=limit,
+                        after=after,
                     )
 
-                return await paginate_query(
+                return await paginate_keyset(
                     db_fetch_func=db_fetch,
                     pagination=pagination,
                     response_schema=CompanyUsersAveragesListResponse,
                     item_schema=AverageScoreResponse,
+                    cursor_key=lambda row: (row.user_id,),
                 )
 
+            except BadRequestException:
+                raise
             except Exception as e:
                 logger.error(
                     f"Error getting users averages for company {company_id}: {e}"
@@ -79,7 +88,7 @@ class CompanyAnalyticsService:
         current_user_id: int,
         from_date: date,
         to_date: date,
-        pagination: PaginationBaseSchema,
+        pagination: CursorPaginationSchema,
     ) -> CompanyUserQuizAveragesListResponse:
         """
         Get paginated average scores per quiz for a selected user
@@ -96,7 +105,9 @@ class CompanyAnalyticsService:
         async with self._uow:
             try:
 
-                async def db_fetch(skip: int, limit: int):
+                async def db_fetch(after: tuple | None, skip: int, limit: int):
+                    if after is not None:
+                        after = parse_cursor_key(after, str, int)
                     return await self._uow.company_analytic.get_company_user_quiz_averages_paginated(
                         company_id=company_id,
                         target_user_id=target_user_id,
@@ -104,15 +115,19 @@ class CompanyAnalyticsService:
                         to_date=to_date,
                         skip=skip,
                         limit=limit,
+                        after=after,
                     )
 
-                return await paginate_query(
+                return await paginate_keyset(
                     db_fetch_func=db_fetch,
                     pagination=pagination,
                     response_schema=CompanyUserQuizAveragesListResponse,
                     item_schema=AverageScoreResponse,
+                    cursor_key=lambda row: (row.quiz_title, row.quiz_id),
                 )
 
+            except BadRequestException:
+                raise
             except Exception as e:
                 logger.error(
                     f"Error getting quiz averages for user {target_user_id} "
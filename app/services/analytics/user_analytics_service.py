@@ -10,8 +10,11 @@ from app.schemas.analytics.user_analytics import (
     UserQuizLastCompletionListResponse,
     UserQuizLastCompletionResponse,
 )
-from app.schemas.pagination.pagination import PaginationBaseSchema
-from app.utils.pagination import paginate_query
+from app.schemas.pagination.pagination import (
+    CursorPaginationSchema,
+    PaginationBaseSchema,
+)
+from app.utils.pagination import paginate_keyset, paginate_query, parse_cursor_key
 
 
 class UserAnalyticsService:
@@ -51,7 +54,7 @@ class UserAnalyticsService:
         user_id: int,
         from_date: date,
         to_date: date,
-        pagination: PaginationBaseSchema,
+        pagination: CursorPaginationSchema,
     ) -> UserQuizAveragesListResponse:
         """
         Get paginated average scores per quiz for a user.
@@ -61,7 +64,9 @@ class UserAnalyticsService:
         async with self._uow:
             try:
 
-                async def db_fetch(skip: int, limit: int):
+                async def db_fetch(after: tuple | None, skip: int, limit: int):
+                    if after is not None:
+                        after = parse_cursor_key(after, str, int)
                     return (
                         await self._uow.user_analytic.get_user_quiz_averages_paginated(
                             user_id=user_id,
@@ -69,16 +74,20 @@ class UserAnalyticsService:
                             to_date=to_date,
                             skip=skip,
                             limit=limit,
+                            after=after,
                         )
                     )
 
-                return await paginate_query(
+                return await paginate_keyset(
                     db_fetch_func=db_fetch,
                     pagination=pagination,
                     response_schema=UserQuizAveragesListResponse,
                     item_schema=UserQuizAverageResponse,
+                    cursor_key=lambda row: (row.quiz_title, row.quiz_id),
                 )
 
+            except BadRequestException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting quiz averages for user {user_id}: {e}")
                 raise ServiceException("Failed to retrieve user quiz averages")
@@ -48,10 +48,7 @@ class BaseMembershipService(ABC):
             )
 
     async def _check_existing_member(self, company_id: int, user_id: int):
-        existing_member = await self._uow.company_member.get_member_by_ids(
-            company_id, user_id
-        )
-        if existing_member:
+        if await self._uow.company_member.is_member(company_id, user_id):
             raise BadRequestException("User is already a member of this company")
 
     async def _create_member(self, company_id: int, user_id: int) -> CompanyMember:
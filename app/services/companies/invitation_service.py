@@ -46,20 +46,14 @@ class InvitationService(BaseMembershipService):
                 if not user:
                     raise NotFoundException(f"User with email {user_email} not found")
 
-                existing_member = await self._uow.company_member.get_member_by_ids(
-                    company_id, user.id
-                )
-                if existing_member:
+                if await self._uow.company_member.is_member(company_id, user.id):
                     raise BadRequestException(
                         "User is already a member of this company"
                     )
 
-                existing_invitation = (
-                    await self._uow.invitations.get_pending_by_company_and_user(
-                        company_id, user.id
-                    )
-                )
-                if existing_invitation:
+                if await self._uow.invitations.has_pending_by_company_and_user(
+                    company_id, user.id
+                ):
                     raise ConflictException(
                         "Pending invitation already exists for this user"
                     )
@@ -41,20 +41,14 @@ class RequestService(BaseMembershipService):
                 if not company:
                     raise NotFoundException(f"Company with id={company_id} not found")
 
-                existing_member = await self._uow.company_member.get_member_by_ids(
-                    company_id, user_id
-                )
-                if existing_member:
+                if await self._uow.company_member.is_member(company_id, user_id):
                     raise BadRequestException(
                         "You are already a member of this company"
                     )
 
-                existing_request = (
-                    await self._uow.requests.get_pending_by_company_and_user(
-                        company_id, user_id
-                    )
-                )
-                if existing_request:
+                if await self._uow.requests.has_pending_by_company_and_user(
+                    company_id, user_id
+                ):
                     raise ConflictException(
                         f"You already have a pending request to company {company_id}"
                     )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from app.core.exceptions import NotFoundException, ServiceException
+from app.core.exceptions import BadRequestException, NotFoundException, ServiceException
 from app.core.logger import logger
 from app.core.unit_of_work import AbstractUnitOfWork
 from app.enums.notification_status import NotificationStatus
@@ -14,12 +15,24 @@ from app.schemas import (
     NotificationsListResponse,
     NotificationsPaginationRequest,
 )
-from app.utils.pagination import paginate_query
+from app.utils.pagination import paginate_keyset
 
 if TYPE_CHECKING:
+    from app.services.notification.unread_count_cache import UnreadCountCache
     from app.services.notification.websocket_service import WebSocketService
 
 
+def _parse_notification_key(key: tuple) -> tuple[datetime, int]:
+    """Turn a decoded (created_at, id) cursor key back into typed values."""
+    try:
+        created_at, id_ = key
+        if not isinstance(id_, int):
+            raise TypeError
+        return datetime.fromisoformat(created_at), id_
+    except (TypeError, ValueError):
+        raise BadRequestException("Invalid cursor")
+
+
 class NotificationService:
     """Service for notification business logic."""
 
@@ -27,9 +40,32 @@ class NotificationService:
         self,
         uow: AbstractUnitOfWork,
         websocket_service: WebSocketService | None = None,
+        unread_cache: UnreadCountCache | None = None,
     ):
         self._uow = uow
         self._websocket_service = websocket_service
+        self._unread_cache = unread_cache
+
+    async def _get_unread_count(self, user_id: int) -> int:
+        if self._unread_cache:
+            cached = await self._unread_cache.get(user_id)
+            if cached is not None:
+                return cached
+
+        count = await self._uow.notifications.get_unread_count(user_id)
+
+        if self._unread_cache:
+            await self._unread_cache.set(user_id, count)
+
+        return count
+
+    async def invalidate_unread_counts(self, *user_ids: int) -> None:
+        """
+        Drop cached unread counts. Call only after the commit that changed
+        them, or a concurrent read may re-cache the old committed count.
+        """
+        if self._unread_cache:
+            await self._unread_cache.invalidate(*user_ids)
 
     async def create_notification(
         self,
@@ -42,6 +78,7 @@ class NotificationService:
         NOTE:
         - Does NOT commit
         - Must be called inside active UoW
+        - Caller invalidates unread counts after committing
         """
         notification = Notification(
             user_id=user_id,
@@ -63,23 +100,23 @@ class NotificationService:
         Assumes:
         - permissions already checked
         - UoW already opened by caller
+        - caller commits, then invalidates unread counts
         """
         members, _ = await self._uow.company_member.get_many_by_filters(
             self._uow.company_member.model.company_id == company_id
         )
 
         message = f'New quiz "{quiz_title}" has been created in your company.'
-        notifications: list[Notification] = []
-
-        for member in members:
-            if exclude_user_id and member.user_id == exclude_user_id:
-                continue
-
-            notification = await self.create_notification(
+        notifications = [
+            Notification(
                 user_id=member.user_id,
                 message=message,
+                status=NotificationStatus.UNREAD,
             )
-            notifications.append(notification)
+            for member in members
+            if not (exclude_user_id and member.user_id == exclude_user_id)
+        ]
+        await self._uow.notifications.create_many(notifications)
 
         logger.info(
             "Created %s notifications for quiz '%s' in company %s",
@@ -98,26 +135,32 @@ class NotificationService:
         """Get paginated notifications for a user."""
         async with self._uow:
             try:
-                unread_count = await self._uow.notifications.get_unread_count(user_id)
+                unread_count = await self._get_unread_count(user_id)
 
-                async def db_fetch(skip: int, limit: int):
+                async def db_fetch(after: tuple | None, skip: int, limit: int):
+                    if after is not None:
+                        after = _parse_notification_key(after)
                     return await self._uow.notifications.get_by_user_id(
                         user_id=user_id,
                         skip=skip,
                         limit=limit,
                         unread_only=pagination.unread_only,
+                        after=after,
                     )
 
-                response = await paginate_query(
+                response = await paginate_keyset(
                     db_fetch_func=db_fetch,
                     pagination=pagination,
                     response_schema=NotificationsListResponse,
                     item_schema=NotificationResponse,
+                    cursor_key=lambda n: (n.created_at.isoformat(), n.id),
                 )
 
                 response.unread_count = unread_count
                 return response
 
+            except BadRequestException:
+                raise
             except Exception as e:
                 logger.error(
                     "Error fetching notifications for user %s: %s",
@@ -147,6 +190,7 @@ class NotificationService:
                 raise NotFoundException("Notification not found")
 
             await self._uow.commit()
+            await self.invalidate_unread_counts(user_id)
 
             if self._websocket_service:
                 await self._websocket_service.broadcast_notification_read(
@@ -174,6 +218,7 @@ class NotificationService:
         try:
             marked_count = await self._uow.notifications.mark_all_as_read(user_id)
             await self._uow.commit()
+            await self.invalidate_unread_counts(user_id)
 
             if self._websocket_service and marked_count > 0:
                 await self._websocket_service.broadcast_all_notifications_read(user_id)
@@ -0,0 +1,53 @@
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.logger import logger
+
+
+class UnreadCountCache:
+    """
+    Short-lived Redis cache of per-user unread notification counts.
+
+    Entries are dropped whenever a user's unread set changes and otherwise
+    expire after TTL_SECONDS. Redis failures are logged and treated as a
+    miss, so callers fall back to the database.
+    """
+
+    TTL_SECONDS = 30
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    @staticmethod
+    def _build_key(user_id: int) -> str:
+        return f"notifications:unread:{user_id}"
+
+    async def get(self, user_id: int) -> int | None:
+        """Return the cached count, or None on a miss."""
+        try:
+            value = await self._redis.get(self._build_key(user_id))
+        except RedisError as e:
+            logger.warning("Failed to read unread count for user %s: %s", user_id, e)
+            return None
+
+        return int(value) if value is not None else None
+
+    async def set(self, user_id: int, count: int) -> None:
+        try:
+            await self._redis.set(self._build_key(user_id), count, ex=self.TTL_SECONDS)
+        except RedisError as e:
+            logger.warning("Failed to cache unread count for user %s: %s", user_id, e)
+
+    async def invalidate(self, *user_ids: int) -> None:
+        """Drop cached counts so the next read recounts from the database."""
+        if not user_ids:
+            return
+
+        try:
+            await self._redis.delete(*(self._build_key(uid) for uid in user_ids))
+        except RedisError as e:
+            logger.warning(
+                "Failed to invalidate unread counts for %s users: %s",
+                len(user_ids),
+                e,
+            )
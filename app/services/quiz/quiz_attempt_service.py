@@ -9,6 +9,7 @@ from app.core.exceptions import (
 )
 from app.core.logger import logger
 from app.core.unit_of_work import AbstractUnitOfWork
+from app.db.quiz.attempt_repository import UserAttemptStats
 from app.models import Quiz, User
 from app.schemas import (
     PaginationBaseSchema,
@@ -21,6 +22,7 @@ from app.schemas import (
 from app.services.companies.permission_service import PermissionService
 from app.services.quiz.quiz_redis_service import RedisQuizService
 from app.services.quiz.quiz_service import QuizService
+from app.services.quiz.user_stats_cache import UserStatsCache
 from app.utils.pagination import paginate_query
 
 
@@ -33,11 +35,13 @@ class QuizAttemptService:
         permission_service: PermissionService,
         quiz_service: QuizService,
         redis_quiz_service: RedisQuizService,
+        stats_cache: UserStatsCache | None = None,
     ):
         self._uow = uow
         self._permisson_service = permission_service
         self._quiz_service = quiz_service
         self._redis_quiz_service = redis_quiz_service
+        self._stats_cache = stats_cache
 
     async def submit_quiz_attempt(
         self,
@@ -54,9 +58,9 @@ class QuizAttemptService:
         1. Get quiz with company (eager loaded)
         2. Validate company is visible
         3. Validate all answers
-        4. Create attempt
-        5. Create user answers
-        6. Calculate score and mark completed
+        4. Calculate score
+        5. Create completed attempt
+        6. Create user answers
         7. Return response
         """
         async with self._uow:
@@ -70,13 +74,6 @@ class QuizAttemptService:
 
                 self._validate_quiz_answers(quiz, data)
 
-                attempt = await self._uow.quiz_attempt.create_attempt(
-                    user_id=current_user.id,
-                    quiz_id=quiz_id,
-                    company_id=quiz.company_id,
-                    total_questions=len(quiz.questions),
-                )
-
                 answers_data = []
                 for user_answer in data.answers:
                     question = self._find_question(quiz, user_answer.question_id)
@@ -84,17 +81,27 @@ class QuizAttemptService:
 
                     answers_data.append(
                         {
-                            "attempt_id": attempt.id,
                             "question_id": user_answer.question_id,
                             "answer_id": user_answer.answer_id,
                             "is_correct": selected_answer.is_correct,
                         }
                     )
 
-                await self._uow.quiz_user_answer.bulk_create_answers(answers_data)
+                # The score is known before anything is written, so the
+                # attempt is inserted already completed: no follow-up UPDATE
+                attempt = await self._uow.quiz_attempt.create_attempt(
+                    user_id=current_user.id,
+                    quiz_id=quiz_id,
+                    company_id=quiz.company_id,
+                    total_questions=len(quiz.questions),
+                    score=sum(answer["is_correct"] for answer in answers_data),
+                    completed_at=datetime.now(timezone.utc),
+                )
 
-                await self._uow.session.refresh(attempt, ["user_answers"])
-                attempt.mark_completed()
+                for answer in answers_data:
+                    answer["attempt_id"] = attempt.id
+
+                await self._uow.quiz_user_answer.bulk_create_answers(answers_data)
 
                 redis_payloads = self._build_redis_payloads(
                     user_id=current_user.id,
@@ -108,6 +115,9 @@ class QuizAttemptService:
 
                 await self._uow.commit()
 
+                if self._stats_cache:
+                    await self._stats_cache.invalidate(current_user.id, quiz.company_id)
+
                 completed_attempt = await self._uow.quiz_attempt.get_with_details(
                     attempt.id
                 )
@@ -140,36 +150,22 @@ class QuizAttemptService:
         """
         async with self._uow:
             try:
-                global_average = (
-                    await self._uow.quiz_attempt.calculate_user_global_average(
-                        current_user.id
-                    )
-                )
+                # One aggregate query per scope instead of one per figure
+                global_stats = await self._get_user_stats(current_user.id)
 
-                company_average = None
+                scoped_stats = global_stats
                 if company_id is not None:
-                    company_average = (
-                        await self._uow.quiz_attempt.calculate_user_company_average(
-                            current_user.id, company_id
-                        )
-                    )
-
-                total_quizzes_taken = (
-                    await self._uow.quiz_attempt.count_user_completed_attempts(
-                        current_user.id,
-                        company_id=company_id,
+                    scoped_stats = await self._get_user_stats(
+                        current_user.id, company_id
                     )
-                )
-
-                last_attempt_at = await self._uow.quiz_attempt.get_user_last_attempt(
-                    current_user.id
-                )
 
                 return UserQuizStatisticsResponse(
-                    global_average=global_average,
-                    company_average=company_average,
-                    total_quizzes_taken=total_quizzes_taken,
-                    last_attempt_at=last_attempt_at,
+                    global_average=global_stats.average,
+                    company_average=(
+                        scoped_stats.average if company_id is not None else None
+                    ),
+                    total_quizzes_taken=scoped_stats.attempt_count,
+                    last_attempt_at=global_stats.last_completed_at,
                 )
 
             except Exception as e:
@@ -178,6 +174,21 @@ class QuizAttemptService:
                 )
                 raise ServiceException("Failed to retrieve user statistics")
 
+    async def _get_user_stats(
+        self, user_id: int, company_id: int | None = None
+    ) -> UserAttemptStats:
+        if not self._stats_cache:
+            return await self._uow.quiz_attempt.get_user_stats(user_id, company_id)
+
+        cached, generation = await self._stats_cache.get(user_id, company_id)
+        if cached is not None:
+            return cached
+
+        stats = await self._uow.quiz_attempt.get_user_stats(user_id, company_id)
+        await self._stats_cache.set(user_id, company_id, stats, generation)
+
+        return stats
+
     async def get_user_quiz_history(
         self,
         current_user: User,
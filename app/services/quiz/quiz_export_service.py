@@ -28,12 +28,12 @@ class QuizExportService:
 
         async with self._uow:
             try:
-                attempts = await self._uow.quiz_attempt.get_answers_for_export(
+                rows = self._uow.quiz_attempt.get_answers_for_export(
                     user_id=user_id,
                     quiz_id=quiz_id,
                 )
 
-                return self._map_attempts_to_answers(attempts)
+                return [QuizAnswerExportData.model_validate(row) async for row in rows]
             except Exception as e:
                 logger.error(
                     "Failed to export user %s data: %s",
@@ -67,13 +67,13 @@ class QuizExportService:
                             f"Quiz {quiz_id} does not belong to company {company_id}"
                         )
 
-                attempts = await self._uow.quiz_attempt.get_answers_for_export(
+                rows = self._uow.quiz_attempt.get_answers_for_export(
                     company_id=company_id,
                     user_id=user_id,
                     quiz_id=quiz_id,
                 )
 
-                return self._map_attempts_to_answers(attempts)
+                return [QuizAnswerExportData.model_validate(row) async for row in rows]
 
             except NotFoundException:
                 raise
@@ -86,24 +86,3 @@ class QuizExportService:
                     exc_info=True,
                 )
                 raise ServiceException("Failed to export company data")
-
-    @staticmethod
-    def _map_attempts_to_answers(attempts) -> list[QuizAnswerExportData]:
-        results: list[QuizAnswerExportData] = []
-
-        for attempt in attempts:
-            for answer in attempt.user_answers:
-                results.append(
-                    QuizAnswerExportData(
-                        user_id=attempt.user_id,
-                        company_id=attempt.company_id,
-                        quiz_id=attempt.quiz_id,
-                        attempt_id=attempt.id,
-                        question_id=answer.question_id,
-                        answer_id=answer.answer_id,
-                        is_correct=answer.is_correct,
-                        answered_at=answer.answered_at,
-                    )
-                )
-
-        return results
@@ -70,6 +70,9 @@ class QuizService:
                 )
 
                 await self._uow.commit()
+                await self._notification_service.invalidate_unread_counts(
+                    *(n.user_id for n in notifications)
+                )
 
                 await self._uow.quiz.refresh_after_create_or_update(created_quiz)
 
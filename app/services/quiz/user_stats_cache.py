@@ -0,0 +1,144 @@
+from datetime import datetime
+
+import orjson
+from cachetools import TTLCache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.logger import logger
+from app.db.quiz.attempt_repository import UserAttemptStats
+
+
+class UserStatsCache:
+    """
+    Two-tier cache of per-user attempt statistics.
+
+    A small in-process TTLCache sits in front of Redis, so repeated reads
+    by the same worker skip the Redis round trip as well as the aggregate
+    query. Entries are invalidated when the user completes an attempt; the
+    in-process tier of other workers may lag by up to LOCAL_TTL_SECONDS.
+    Redis failures are logged and treated as a miss.
+
+    Each user has a generation counter that invalidate() bumps. get()
+    returns the generation next to the stats, and set() tags the value with
+    it, so stats computed before a concurrent invalidation are never served
+    afterwards, even if they are written back after it.
+    """
+
+    TTL_SECONDS = 300
+    # Outlives any value tagged before the last bump, so a counter that
+    # expired and restarted can never match a stale tag again
+    GENERATION_TTL_SECONDS = 2 * TTL_SECONDS
+    LOCAL_TTL_SECONDS = 10
+    LOCAL_MAXSIZE = 1024
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+        self._local: TTLCache = TTLCache(
+            maxsize=self.LOCAL_MAXSIZE, ttl=self.LOCAL_TTL_SECONDS
+        )
+        # Latest generation this worker invalidated to, per user
+        self._local_generations: TTLCache = TTLCache(
+            maxsize=self.LOCAL_MAXSIZE, ttl=self.LOCAL_TTL_SECONDS
+        )
+
+    @staticmethod
+    def _build_key(user_id: int, company_id: int | None) -> str:
+        scope = "all" if company_id is None else company_id
+        return f"quiz-stats:{user_id}:{scope}"
+
+    @staticmethod
+    def _generation_key(user_id: int) -> str:
+        return f"quiz-stats:{user_id}:generation"
+
+    @staticmethod
+    def _dump(generation: int, stats: UserAttemptStats) -> bytes:
+        return orjson.dumps([generation, *stats])
+
+    @staticmethod
+    def _load(raw: str | bytes) -> tuple[int, UserAttemptStats]:
+        generation, total_score, total_questions, attempt_count, last = orjson.loads(
+            raw
+        )
+        return generation, UserAttemptStats(
+            total_score,
+            total_questions,
+            attempt_count,
+            datetime.fromisoformat(last) if last is not None else None,
+        )
+
+    async def get(
+        self, user_id: int, company_id: int | None = None
+    ) -> tuple[UserAttemptStats | None, int | None]:
+        """
+        Return (stats, generation). stats is None on a miss; pass the
+        generation to set() when caching freshly computed stats.
+        generation is None when Redis could not be read.
+        """
+        key = self._build_key(user_id, company_id)
+
+        stats = self._local.get(key)
+        if stats is not None:
+            return stats, None
+
+        try:
+            raw, raw_generation = await self._redis.mget(
+                key, self._generation_key(user_id)
+            )
+        except RedisError as e:
+            logger.warning("Failed to read stats cache for user %s: %s", user_id, e)
+            return None, None
+
+        generation = int(raw_generation or 0)
+        if raw is None:
+            return None, generation
+
+        cached_generation, stats = self._load(raw)
+        if cached_generation != generation:
+            return None, generation
+
+        self._local[key] = stats
+        return stats, generation
+
+    async def set(
+        self,
+        user_id: int,
+        company_id: int | None,
+        stats: UserAttemptStats,
+        generation: int | None,
+    ) -> None:
+        """Cache stats computed after get() returned this generation."""
+        if generation is None:
+            return
+        if generation < self._local_generations.get(user_id, 0):
+            # Invalidated while the stats were being computed
+            return
+
+        key = self._build_key(user_id, company_id)
+        self._local[key] = stats
+
+        try:
+            await self._redis.set(
+                key, self._dump(generation, stats), ex=self.TTL_SECONDS
+            )
+        except RedisError as e:
+            logger.warning("Failed to cache stats for user %s: %s", user_id, e)
+
+    async def invalidate(self, user_id: int, company_id: int) -> None:
+        """Drop the user's global stats and their stats for company_id."""
+        keys = [self._build_key(user_id, None), self._build_key(user_id, company_id)]
+        for key in keys:
+            self._local.pop(key, None)
+
+        generation_key = self._generation_key(user_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, self.GENERATION_TTL_SECONDS)
+                pipe.delete(*keys)
+                generation, *_ = await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to invalidate stats for user %s: %s", user_id, e)
+            return
+
+        self._local_generations[user_id] = generation
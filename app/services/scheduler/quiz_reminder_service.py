@@ -7,6 +7,7 @@ from app.core.logger import logger
 from app.core.unit_of_work import AbstractUnitOfWork, SQLAlchemyUnitOfWork
 from app.enums.notification_status import NotificationStatus
 from app.models.notification.notification import Notification
+from app.services.notification.unread_count_cache import UnreadCountCache
 
 
 class QuizReminderService:
@@ -17,8 +18,13 @@ class QuizReminderService:
 
     REMINDER_WINDOW_HOURS = 24
 
-    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork] | None = None):
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork] | None = None,
+        unread_cache: UnreadCountCache | None = None,
+    ):
         self._uow_factory = uow_factory or SQLAlchemyUnitOfWork
+        self._unread_cache = unread_cache
 
     async def send_quiz_reminders(self) -> int:
         """
@@ -28,7 +34,7 @@ class QuizReminderService:
             Total number of notifications created.
         """
         since = datetime.now(timezone.utc) - timedelta(hours=self.REMINDER_WINDOW_HOURS)
-        total = 0
+        notifications: list[Notification] = []
 
         async with self._uow_factory() as uow:
             quizzes, _ = await uow.quiz.get_all(skip=0, limit=100_000)
@@ -40,20 +46,26 @@ class QuizReminderService:
                     since=since,
                 )
 
-                for user_id in user_ids:
-                    notification = Notification(
+                message = (
+                    f'Don\'t forget to complete quiz "{quiz.title}" '
+                    f"— you haven't done it today!"
+                )
+                notifications.extend(
+                    Notification(
                         user_id=user_id,
-                        message=(
-                            f'Don\'t forget to complete quiz "{quiz.title}" '
-                            f"— you haven't done it today!"
-                        ),
+                        message=message,
                         status=NotificationStatus.UNREAD,
                     )
-                    await uow.notifications.create_one(notification)
-                    total += 1
+                    for user_id in user_ids
+                )
 
+            total = len(notifications)
             if total > 0:
+                await uow.notifications.create_many(notifications)
                 await uow.commit()
 
+        if self._unread_cache and total > 0:
+            await self._unread_cache.invalidate(*{n.user_id for n in notifications})
+
         logger.info("Quiz reminders sent: %s notifications created", total)
         return total
@@ -10,7 +10,7 @@ from app.core.security import (
     create_refresh_token,
     decode_access_token,
     decode_refresh_token,
-    verify_password,
+    verify_password_async,
 )
 from app.core.unit_of_work import AbstractUnitOfWork
 from app.models import User
@@ -36,20 +36,20 @@ class AuthService:
 
                 if not user:
                     logger.debug(
-                        f"Authentication failed: user with email {email} not found"
+                        "Authentication failed: user with email %s not found", email
                     )
                     raise UnauthorizedException("Invalid email or password")
 
-                if not verify_password(password, user.hashed_password):
+                if not await verify_password_async(password, user.hashed_password):
                     logger.debug(
-                        f"Authentication failed: invalid password for user {email}"
+                        "Authentication failed: invalid password for user %s", email
                     )
                     raise UnauthorizedException("Invalid email or password")
 
                 access_token = create_access_token(data={"sub": str(user.id)})
                 refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
-                logger.info(f"User authenticated successfully: {email}")
+                logger.info("User authenticated successfully: %s", email)
 
                 return {
                     "access_token": access_token,
@@ -60,7 +60,7 @@ class AuthService:
             except UnauthorizedException:
                 raise
             except Exception as e:
-                logger.error(f"Error authenticating user {email}: {str(e)}")
+                logger.error("Error authenticating user %s: %s", email, e)
                 raise ServiceException("Authentication failed")
 
     async def get_current_user_from_token(self, token: str) -> User:
@@ -89,7 +89,7 @@ class AuthService:
             # Конвертуємо HTTP 401 у WebSocket Close Code 1008
             raise WebSocketAuthException(reason=str(e.detail))
         except Exception as e:
-            logger.error(f"Unexpected error validating WebSocket token: {str(e)}")
+            logger.error("Unexpected error validating WebSocket token: %s", e)
             raise WebSocketAuthException(reason="Authentication failed")
 
     async def _try_get_user_from_jwt(self, token: str) -> User | None:
@@ -110,17 +110,17 @@ class AuthService:
             async with self._uow:
                 user = await self._uow.users.get_one_by_id(int(user_id))
             if not user:
-                logger.debug(f"User with ID {user_id} not found")
+                logger.debug("User with ID %s not found", user_id)
                 return None
 
-            logger.debug(f"User authenticated from JWT token: {user.email}")
+            logger.debug("User authenticated from JWT token: %s", user.email)
             return user
 
         except ValueError as e:
-            logger.debug(f"JWT token validation failed: {str(e)}")
+            logger.debug("JWT token validation failed: %s", e)
             return None
         except Exception as e:
-            logger.debug(f"Unexpected error validating JWT token: {str(e)}")
+            logger.debug("Unexpected error validating JWT token: %s", e)
             return None
 
     async def _try_get_user_from_auth0(self, token: str) -> User | None:
@@ -130,8 +130,8 @@ class AuthService:
         Auto-creates user if they don't exist.
         """
         try:
-            verify_auth0_token(token)
-            email = get_email_from_auth0_token(token)
+            await verify_auth0_token(token)
+            email = await get_email_from_auth0_token(token)
 
             if not email:
                 logger.warning("No email found in Auth0 token")
@@ -140,18 +140,18 @@ class AuthService:
             async with self._uow:
                 user = await self._uow.users.get_by_email(email)
             if not user:
-                logger.info(f"Auth0 user not found, creating new user: {email}")
+                logger.info("Auth0 user not found, creating new user: %s", email)
                 user = await self._user_service.create_user(email, is_external=True)
             else:
-                logger.debug(f"User authenticated from Auth0 token: {user.email}")
+                logger.debug("User authenticated from Auth0 token: %s", user.email)
 
             return user
 
         except Auth0Error as e:
-            logger.debug(f"Auth0 token verification failed: {str(e)}")
+            logger.debug("Auth0 token verification failed: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error validating Auth0 token: {str(e)}")
+            logger.error("Error validating Auth0 token: %s", e)
             return None
 
     async def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
@@ -177,7 +177,7 @@ class AuthService:
         new_access_token = create_access_token(data={"sub": str(user.id)})
         new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
-        logger.info(f"Issued new tokens for user {user.email}")
+        logger.info("Issued new tokens for user %s", user.email)
 
         return {
             "access_token": new_access_token,
@@ -9,7 +9,7 @@ from app.core.exceptions import (
     ServiceException,
 )
 from app.core.logger import logger
-from app.core.security import hash_password
+from app.core.security import hash_password_async, hash_token
 from app.core.unit_of_work import AbstractUnitOfWork
 from app.models import User
 from app.schemas import (
@@ -45,10 +45,11 @@ class UserService:
                 if existing_user:
                     raise ConflictException(f"User with email {email} already exists")
 
-                if not password:
-                    password = secrets.token_urlsafe(32)
-
-                hashed_password = hash_password(password)
+                if password:
+                    hashed_password = await hash_password_async(password)
+                else:
+                    # Random secret nobody types in: HMAC is enough, skip bcrypt
+                    hashed_password = hash_token(secrets.token_urlsafe(32))
                 user = User(
                     email=email,
                     full_name=full_name or email.split("@")[0].capitalize(),
@@ -152,7 +153,7 @@ class UserService:
                     setattr(user, field, value)
 
                 if user_data.password:
-                    user.hashed_password = hash_password(user_data.password)
+                    user.hashed_password = await hash_password_async(user_data.password)
 
                 updated_user = await self._uow.users.update_one(user)
 
@@ -0,0 +1,21 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+
+import orjson
+
+
+def encode_cursor(key: tuple) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor produced by encode_cursor back into a sort key."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeEncodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, list):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
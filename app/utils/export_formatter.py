@@ -1,6 +1,6 @@
 import csv
 import io
-from typing import Any, List
+from typing import Any
 
 from fastapi.responses import Response
 
@@ -59,7 +59,7 @@ class CSVFormatter:
         }
 
 
-def make_csv_response(answers: List[QuizAnswerExportData], filename: str) -> Response:
+def make_csv_response(answers: list[QuizAnswerExportData], filename: str) -> Response:
     content = CSVFormatter.format_to_csv(answers)
     return Response(
         content=content,
@@ -69,7 +69,7 @@ def make_csv_response(answers: List[QuizAnswerExportData], filename: str) -> Res
 
 
 def make_json_response(
-    answers: List[QuizAnswerExportData],
+    answers: list[QuizAnswerExportData],
     *,
     user_id: int | None = None,
     company_id: int | None = None,
@@ -1,11 +1,32 @@
-from typing import Awaitable, Callable, Type
+from typing import Any, Awaitable, Callable, Type
 
+from app.core.exceptions import BadRequestException
 from app.schemas.pagination.pagination import (
+    CursorPaginatedResponseBaseSchema,
+    CursorPaginationSchema,
     ModelType,
     PaginatedResponseBaseSchema,
     PaginationBaseSchema,
     ResponseType,
 )
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+def _total_pages(total: int, limit: int) -> int:
+    return (total + limit - 1) // limit if limit > 0 else 1
+
+
+def parse_cursor_key(key: tuple, *types: type) -> tuple:
+    """
+    Check that a decoded cursor key has one element of each given type, so a
+    tampered cursor is a 400 instead of a failed query. Raises
+    BadRequestException.
+    """
+    if len(key) != len(types) or not all(
+        type(value) is expected for value, expected in zip(key, types)
+    ):
+        raise BadRequestException("Invalid cursor")
+    return key
 
 
 async def paginate_query(
@@ -21,16 +42,55 @@ async def paginate_query(
     skip = (pagination.page - 1) * pagination.limit
     items, total = await db_fetch_func(skip, pagination.limit)
     item_responses = [item_schema.model_validate(item) for item in items]
-    total_pages = (
-        (total + pagination.limit - 1) // pagination.limit
-        if pagination.limit > 0
-        else 1
+
+    return response_schema(
+        total=total,
+        page=pagination.page,
+        limit=pagination.limit,
+        total_pages=_total_pages(total, pagination.limit),
+        results=item_responses,
+    )
+
+
+async def paginate_keyset(
+    db_fetch_func: Callable[
+        [tuple | None, int, int], Awaitable[tuple[list[ModelType], int]]
+    ],
+    pagination: CursorPaginationSchema,
+    response_schema: Type[CursorPaginatedResponseBaseSchema[ResponseType]],
+    item_schema: Type[ResponseType],
+    cursor_key: Callable[[Any], tuple],
+) -> CursorPaginatedResponseBaseSchema[ResponseType]:
+    """
+    Like paginate_query, but also supports seek pagination.
+
+    db_fetch_func receives (after, skip, limit): with a cursor, `after` is
+    the sort key of the last row already seen and skip is 0, so the database
+    seeks past it instead of scanning and discarding OFFSET rows. Without a
+    cursor the page number is used as before. next_cursor is set whenever
+    the page is full. A malformed cursor raises BadRequestException.
+    """
+    if pagination.cursor is not None:
+        try:
+            after, skip = decode_cursor(pagination.cursor), 0
+        except ValueError:
+            raise BadRequestException("Invalid cursor")
+    else:
+        after, skip = None, (pagination.page - 1) * pagination.limit
+
+    items, total = await db_fetch_func(after, skip, pagination.limit)
+    item_responses = [item_schema.model_validate(item) for item in items]
+    next_cursor = (
+        encode_cursor(cursor_key(items[-1]))
+        if items and len(items) == pagination.limit
+        else None
     )
 
     return response_schema(
         total=total,
         page=pagination.page,
         limit=pagination.limit,
-        total_pages=total_pages,
+        total_pages=_total_pages(total, pagination.limit),
         results=item_responses,
+        next_cursor=next_cursor,
     )
@@ -13,8 +13,10 @@ from app.core.database import Base
 from app.core.dependencies import (
     get_auth_service,
     get_redis_quiz_service,
+    get_unread_count_cache,
     get_uow,
     get_user_service,
+    get_user_stats_cache,
 )
 from app.core.unit_of_work import AbstractUnitOfWork
 from app.enums import Role
@@ -22,6 +24,7 @@ from app.enums.notification_status import NotificationStatus
 from app.main import app
 from app.models import Company, CompanyMember, User
 from app.models.notification.notification import Notification
+from app.services.quiz.user_stats_cache import UserStatsCache
 from app.services.users.user_service import UserService
 
 # ==================== TEST DATABASE SETUP ====================
@@ -141,10 +144,23 @@ async def override_dependencies_fixture(db_session: AsyncSession):
 
         return RedisQuizService(fake_redis)
 
+    def override_get_unread_count_cache():
+        from app.services.notification.unread_count_cache import UnreadCountCache
+
+        return UnreadCountCache(fake_redis)
+
+    # One instance per test, like the per-process instance in production
+    stats_cache = UserStatsCache(fake_redis)
+
+    def override_get_user_stats_cache():
+        return stats_cache
+
     app.dependency_overrides[get_uow] = override_get_uow
     app.dependency_overrides[get_user_service] = override_get_user_service
     app.dependency_overrides[get_auth_service] = override_get_auth_service
     app.dependency_overrides[get_redis_quiz_service] = override_get_redis_quiz_service
+    app.dependency_overrides[get_unread_count_cache] = override_get_unread_count_cache
+    app.dependency_overrides[get_user_stats_cache] = override_get_user_stats_cache
 
     yield fake_redis
 
@@ -211,3 +211,103 @@ async def test_company_user_quiz_averages_by_date_range(
     assert item.quiz_id == test_quiz.id
     assert item.quiz_title == test_quiz.title
     assert item.average_score == pytest.approx(0.75)
+
+
+async def test_user_quiz_averages_keyset_pages(db_session, test_user, test_quiz):
+    """Seeking past (title, id) returns the same rows as OFFSET paging"""
+    from app.models import Quiz
+
+    repo = UserAnalyticsRepository(db_session)
+
+    # Two quizzes share a title, so the id tiebreak decides their order
+    quizzes = [test_quiz] + [
+        Quiz(title=title, description="desc", company_id=test_quiz.company_id)
+        for title in ("Alpha", "Alpha", "Zulu")
+    ]
+    db_session.add_all(quizzes[1:])
+    await db_session.flush()
+
+    for quiz in quizzes:
+        attempt = QuizAttempt(
+            user_id=test_user.id,
+            quiz_id=quiz.id,
+            company_id=quiz.company_id,
+            total_questions=1,
+        )
+        db_session.add(attempt)
+        await db_session.flush()
+        db_session.add(
+            QuizUserAnswer(
+                attempt_id=attempt.id,
+                question_id=1,
+                answer_id=1,
+                is_correct=True,
+            )
+        )
+    await db_session.commit()
+
+    params = dict(
+        user_id=test_user.id,
+        from_date=date(2000, 1, 1),
+        to_date=date(2100, 1, 1),
+        limit=2,
+    )
+    first, total = await repo.get_user_quiz_averages_paginated(skip=0, **params)
+    by_offset, _ = await repo.get_user_quiz_averages_paginated(skip=2, **params)
+    by_seek, seek_total = await repo.get_user_quiz_averages_paginated(
+        skip=0, after=(first[-1].quiz_title, first[-1].quiz_id), **params
+    )
+
+    assert total == seek_total == 4
+    assert [row.quiz_title for row in first] == ["Alpha", "Alpha"]
+    assert [row.quiz_id for row in by_seek] == [row.quiz_id for row in by_offset]
+    assert [row.quiz_title for row in by_seek] == ["Test Quiz", "Zulu"]
+
+    # Past the last page there is no row carrying COUNT(*) OVER ()
+    past_end, past_end_total = await repo.get_user_quiz_averages_paginated(
+        skip=10, **params
+    )
+    assert past_end == []
+    assert past_end_total == 4
+
+
+async def test_company_users_averages_date_range_is_inclusive(
+    db_session, test_user, test_quiz
+):
+    """to_date includes the whole day; the next day is excluded"""
+    repo = CompanyAnalyticsRepository(db_session)
+
+    day = date(2025, 3, 10)
+    for completed_at, is_correct in (
+        (datetime(2025, 3, 10, 23, 59, tzinfo=timezone.utc), True),
+        (datetime(2025, 3, 11, 0, 0, tzinfo=timezone.utc), False),
+    ):
+        attempt = QuizAttempt(
+            user_id=test_user.id,
+            quiz_id=test_quiz.id,
+            company_id=test_quiz.company_id,
+            total_questions=1,
+            completed_at=completed_at,
+        )
+        db_session.add(attempt)
+        await db_session.flush()
+        db_session.add(
+            QuizUserAnswer(
+                attempt_id=attempt.id,
+                question_id=1,
+                answer_id=1,
+                is_correct=is_correct,
+            )
+        )
+    await db_session.commit()
+
+    items, total = await repo.get_company_users_averages_paginated(
+        company_id=test_quiz.company_id,
+        from_date=day,
+        to_date=day,
+        skip=0,
+        limit=10,
+    )
+
+    assert total == 1
+    assert items[0].average_score == 1.0
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+from app.db.quiz import attempt_repository
+from app.db.quiz.attempt_repository import QuizAttemptRepository, UserAttemptStats
+from app.models import QuizAttempt, QuizUserAnswer
+
+
+async def test_create_one_returns_server_defaults_without_refresh(
+    db_session, test_user, test_quiz
+):
+    attempt = await QuizAttemptRepository(db_session).create_one(
+        QuizAttempt(
+            user_id=test_user.id,
+            quiz_id=test_quiz.id,
+            company_id=test_quiz.company_id,
+            total_questions=1,
+        )
+    )
+
+    # started_at is a server default; reading it must not need a lazy load
+    assert attempt.id is not None
+    assert attempt.started_at is not None
+
+
+async def test_get_user_stats_aggregates_in_one_row(db_session, test_user, test_quiz):
+    repo = QuizAttemptRepository(db_session)
+    completed = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    for score, completed_at in ((1, completed), (3, completed), (0, None)):
+        db_session.add(
+            QuizAttempt(
+                user_id=test_user.id,
+                quiz_id=test_quiz.id,
+                company_id=test_quiz.company_id,
+                total_questions=4,
+                score=score,
+                completed_at=completed_at,
+            )
+        )
+    await db_session.flush()
+
+    stats = await repo.get_user_stats(test_user.id, test_quiz.company_id)
+    other_company = await repo.get_user_stats(test_user.id, test_quiz.company_id + 1)
+
+    assert (stats.total_score, stats.total_questions, stats.attempt_count) == (4, 8, 2)
+    assert stats.last_completed_at is not None
+    assert stats.average == 50.0
+    assert other_company == UserAttemptStats(None, None, 0, None)
+    assert other_company.average is None
+    assert await repo.get_user_last_attempt(test_user.id) == stats.last_completed_at
+
+
+async def test_get_answers_for_export_caps_attempts(
+    db_session, test_user, test_quiz, monkeypatch
+):
+    question = test_quiz.questions[0]
+    attempts = []
+    for day in (1, 2):
+        attempt = QuizAttempt(
+            user_id=test_user.id,
+            quiz_id=test_quiz.id,
+            company_id=test_quiz.company_id,
+            total_questions=1,
+            score=1,
+            completed_at=datetime(2026, 1, day, tzinfo=timezone.utc),
+        )
+        db_session.add(attempt)
+        await db_session.flush()
+        db_session.add(
+            QuizUserAnswer(
+                attempt_id=attempt.id,
+                question_id=question.id,
+                answer_id=question.answers[0].id,
+                is_correct=True,
+            )
+        )
+        attempts.append(attempt)
+    await db_session.flush()
+    monkeypatch.setattr(attempt_repository, "MAX_EXPORT_LIMIT", 1)
+
+    rows = QuizAttemptRepository(db_session).get_answers_for_export(
+        user_id=test_user.id
+    )
+
+    # Only the most recently completed attempt is exported
+    assert [row.attempt_id async for row in rows] == [attempts[1].id]
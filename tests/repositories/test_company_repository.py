@@ -0,0 +1,70 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.company.company_repository import CompanyRepository
+from app.enums import Role
+from app.models import Company
+
+
+async def test_get_by_owner_eager_loads_members(
+    db_session: AsyncSession, company_with_admin: Company
+):
+    repo = CompanyRepository(db_session)
+
+    companies, total = await repo.get_by_owner(
+        owner_id=company_with_admin.owner_id,
+        options=[selectinload(Company.members)],
+    )
+
+    assert total == 1
+    # Accessing an unloaded relationship on an AsyncSession would raise
+    roles = {member.role for member in companies[0].members}
+    assert roles == {Role.OWNER, Role.ADMIN}
+
+
+async def test_get_all_accepts_options(
+    db_session: AsyncSession, company_with_admin: Company
+):
+    repo = CompanyRepository(db_session)
+
+    companies, total = await repo.get_all(options=[selectinload(Company.members)])
+
+    assert total == 1
+    assert len(companies[0].members) == 2
+
+
+async def test_get_visible_companies_returns_projected_rows(
+    db_session: AsyncSession, test_company: Company
+):
+    repo = CompanyRepository(db_session)
+
+    rows, total = await repo.get_visible_companies()
+
+    assert total == 1
+    assert not isinstance(rows[0], Company)
+    assert rows[0].id == test_company.id
+    assert rows[0].name == test_company.name
+
+
+async def test_get_one_by_id_eager_loads_members(
+    db_session: AsyncSession, company_with_admin: Company
+):
+    repo = CompanyRepository(db_session)
+    db_session.expunge_all()
+
+    company = await repo.get_one_by_id(
+        company_with_admin.id, options=[selectinload(Company.members)]
+    )
+
+    assert len(company.members) == 2
+
+
+async def test_is_member(
+    db_session: AsyncSession, company_with_admin: Company, test_member_user
+):
+    from app.db.company.company_member_repository import CompanyMemberRepository
+
+    repo = CompanyMemberRepository(db_session)
+
+    assert await repo.is_member(company_with_admin.id, company_with_admin.owner_id)
+    assert not await repo.is_member(company_with_admin.id, test_member_user.id)
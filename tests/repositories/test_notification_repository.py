@@ -34,6 +34,41 @@ async def test_get_by_user_id_unread_only(
     assert all(n.status == NotificationStatus.UNREAD for n in notifications)
 
 
+async def test_get_by_user_id_total_on_partial_and_past_end_pages(
+    db_session: AsyncSession, test_notifications: list[Notification]
+):
+    repo = NotificationRepository(db_session)
+    user_id = test_notifications[0].user_id
+
+    page, total = await repo.get_by_user_id(user_id=user_id, skip=2, limit=2)
+    past_end, past_end_total = await repo.get_by_user_id(
+        user_id=user_id, skip=10, limit=2
+    )
+
+    assert len(page) == 2
+    assert all(isinstance(n, Notification) for n in page)
+    assert total == 5
+    assert past_end == []
+    assert past_end_total == 5
+
+
+async def test_get_by_user_id_keyset_continues_after_cursor(
+    db_session: AsyncSession, test_notifications: list[Notification]
+):
+    repo = NotificationRepository(db_session)
+    user_id = test_notifications[0].user_id
+
+    first, _ = await repo.get_by_user_id(user_id=user_id, skip=0, limit=2)
+    last = first[-1]
+    second, total = await repo.get_by_user_id(
+        user_id=user_id, skip=99, limit=2, after=(last.created_at, last.id)
+    )
+    offset_page, _ = await repo.get_by_user_id(user_id=user_id, skip=2, limit=2)
+
+    assert total == 5
+    assert [n.id for n in second] == [n.id for n in offset_page]
+
+
 async def test_mark_as_read(
     db_session: AsyncSession, test_notifications: list[Notification]
 ):
@@ -60,3 +95,14 @@ async def test_mark_all_as_read(
 
     assert marked_count == 3
     assert await repo.get_unread_count(user_id) == 0
+
+
+async def test_create_many_populates_ids(db_session: AsyncSession, test_user):
+    repo = NotificationRepository(db_session)
+
+    created = await repo.create_many(
+        [Notification(user_id=test_user.id, message=f"m{i}") for i in range(3)]
+    )
+
+    assert all(n.id is not None for n in created)
+    assert all(n.created_at is not None for n in created)
@@ -0,0 +1,25 @@
+from app.db.quiz.quiz_repository import QuizRepository
+from app.models import QuizAttempt
+
+
+async def test_participation_count_is_computed_without_loading_attempts(
+    db_session, test_user, test_quiz
+):
+    for _ in range(2):
+        db_session.add(
+            QuizAttempt(
+                user_id=test_user.id,
+                quiz_id=test_quiz.id,
+                company_id=test_quiz.company_id,
+                total_questions=1,
+            )
+        )
+    await db_session.flush()
+    repo = QuizRepository(db_session)
+
+    quizzes, _ = await repo.get_by_company(test_quiz.company_id)
+    detailed = await repo.get_with_relations(test_quiz.id)
+
+    assert quizzes[0].participation_count == 2
+    assert detailed.participation_count == 2
+    assert "attempts" not in detailed.__dict__
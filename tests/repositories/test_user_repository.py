@@ -0,0 +1,11 @@
+from app.db.user.user_repository import UserRepository
+
+
+async def test_get_by_email_binds_each_email(db_session, test_user):
+    repo = UserRepository(db_session)
+
+    found = await repo.get_by_email(test_user.email)
+    missing = await repo.get_by_email("nobody@example.com")
+
+    assert found is test_user
+    assert missing is None
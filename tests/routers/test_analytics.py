@@ -2,6 +2,8 @@ from datetime import date, timedelta
 
 from httpx import AsyncClient
 
+from app.utils.cursor import encode_cursor
+
 
 async def test_get_my_overall_analytics_success(
     client: AsyncClient,
@@ -228,3 +230,49 @@ async def test_company_analytics_unauthorized(client: AsyncClient, test_company)
     )
 
     assert response.status_code in (401, 403)
+
+
+async def test_get_my_quiz_averages_cursor(client: AsyncClient, test_user_token):
+    """A next_cursor is only returned for full pages; garbage cursors are 400"""
+    params = {"from_date": "2000-01-01", "to_date": "2100-01-01", "limit": 10}
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+
+    response = await client.get(
+        "/analytics/me/quizzes/averages", headers=headers, params=params
+    )
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+
+    response = await client.get(
+        "/analytics/me/quizzes/averages",
+        headers=headers,
+        params={**params, "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+
+async def test_analytics_cursor_with_wrong_key_shape_is_rejected(
+    client: AsyncClient, test_company, test_user, test_user_token
+):
+    """Cursors that decode but do not match the endpoint's sort key are 400"""
+    params = {"from_date": "2000-01-01", "to_date": "2100-01-01", "limit": 10}
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    company = f"/analytics/companies/{test_company.id}"
+    endpoints = {
+        "/analytics/me/quizzes/averages": ("str", 1),
+        f"{company}/users/averages": (1,),
+        f"{company}/users/{test_user.id}/quizzes/averages": ("str", 1),
+    }
+
+    for url, valid_key in endpoints.items():
+        bad_keys = [(), (*valid_key, 1), tuple(str(v) for v in valid_key)]
+        for key in bad_keys:
+            response = await client.get(
+                url, headers=headers, params={**params, "cursor": encode_cursor(key)}
+            )
+            assert response.status_code == 400, (url, key)
+
+        response = await client.get(
+            url, headers=headers, params={**params, "cursor": encode_cursor(valid_key)}
+        )
+        assert response.status_code == 200, url
@@ -91,6 +91,7 @@ async def test_login_invalid_email(client: AsyncClient):
 
     assert response.status_code == 401
     assert "Invalid email or password" in response.json()["detail"]
+    assert response.headers["www-authenticate"] == "Bearer"
 
 
 async def test_login_invalid_password(client: AsyncClient, test_user: User):
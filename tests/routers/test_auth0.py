@@ -1,3 +1,4 @@
+import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,7 +10,7 @@ from app.models import User
 async def test_auth0_token_creates_new_user(
     client: AsyncClient, db_session: AsyncSession, monkeypatch
 ):
-    def mock_verify_auth0_token(token: str):
+    async def mock_verify_auth0_token(token: str):
         return {
             "sub": "auth0|mock_new_user_123",
             "email": "newauth0user@example.com",
@@ -17,7 +18,7 @@ async def test_auth0_token_creates_new_user(
             "aud": "mock-audience",
         }
 
-    def mock_get_email_from_auth0_token(token: str):
+    async def mock_get_email_from_auth0_token(token: str):
         return "newauth0user@example.com"
 
     monkeypatch.setattr(
@@ -50,7 +51,7 @@ async def test_auth0_token_creates_new_user(
 async def test_auth0_token_existing_user(
     client: AsyncClient, test_user: User, monkeypatch
 ):
-    def mock_verify_auth0_token(token: str):
+    async def mock_verify_auth0_token(token: str):
         return {
             "sub": "auth0|existing_user_456",
             "email": test_user.email,
@@ -58,7 +59,7 @@ async def test_auth0_token_existing_user(
             "aud": "mock-audience",
         }
 
-    def mock_get_email_from_auth0_token(token: str):
+    async def mock_get_email_from_auth0_token(token: str):
         return test_user.email
 
     monkeypatch.setattr(
@@ -80,14 +81,14 @@ async def test_auth0_token_existing_user(
 
 
 async def test_auth0_token_no_email(client: AsyncClient, monkeypatch):
-    def mock_verify_auth0_token(token: str):
+    async def mock_verify_auth0_token(token: str):
         return {
             "sub": "auth0|no_email_123",
             "iss": "https://mock.auth0.com/",
             "aud": "mock-audience",
         }
 
-    def mock_get_email_from_auth0_token(token: str):
+    async def mock_get_email_from_auth0_token(token: str):
         return None
 
     monkeypatch.setattr(
@@ -107,7 +108,7 @@ async def test_auth0_token_no_email(client: AsyncClient, monkeypatch):
 async def test_auth0_token_invalid(client: AsyncClient, monkeypatch):
     from app.core.auth0 import Auth0Error
 
-    def mock_verify_auth0_token(token: str):
+    async def mock_verify_auth0_token(token: str):
         raise Auth0Error("Invalid Auth0 token: signature verification failed")
 
     monkeypatch.setattr(
@@ -119,3 +120,194 @@ async def test_auth0_token_invalid(client: AsyncClient, monkeypatch):
     )
 
     assert response.status_code == 401
+
+
+# ==================== JWKS CACHE TESTS ====================
+
+
+def _token_with_kid(kid: str) -> str:
+    import jwt
+
+    return jwt.encode({"sub": "auth0|kid"}, "secret", headers={"kid": kid})
+
+
+async def test_jwks_is_cached_between_calls(monkeypatch):
+    from app.core import auth0
+
+    calls = []
+
+    async def mock_fetch_jwks(kid=None):
+        calls.append(1)
+        return {"kid-1": "public-key-1"}
+
+    monkeypatch.setattr(auth0, "_fetch_jwks", mock_fetch_jwks)
+    monkeypatch.setattr(auth0, "_JWKS_CACHE", {})
+    monkeypatch.setattr(auth0, "_JWKS_FETCHED_AT", 0.0)
+    monkeypatch.setattr(auth0, "_JWKS_REFETCHED_AT", 0.0)
+
+    token = _token_with_kid("kid-1")
+
+    assert await auth0.get_auth0_public_key(token) == "public-key-1"
+    assert await auth0.get_auth0_public_key(token) == "public-key-1"
+    assert len(calls) == 1
+
+
+async def test_jwks_refetched_on_unknown_kid(monkeypatch):
+    from app.core import auth0
+
+    calls = []
+
+    async def mock_fetch_jwks(kid=None):
+        calls.append(1)
+        return {"kid-2": "public-key-2"}
+
+    monkeypatch.setattr(auth0, "_fetch_jwks", mock_fetch_jwks)
+    monkeypatch.setattr(auth0, "_JWKS_CACHE", {"kid-1": "public-key-1"})
+    monkeypatch.setattr(auth0, "_JWKS_FETCHED_AT", 10**12)
+    monkeypatch.setattr(auth0, "_JWKS_REFETCHED_AT", 0.0)
+
+    token = _token_with_kid("kid-2")
+
+    assert await auth0.get_auth0_public_key(token) == "public-key-2"
+    assert len(calls) == 1
+
+
+async def test_jwks_unknown_kid_refetch_is_throttled(monkeypatch):
+    from app.core import auth0
+
+    calls = []
+
+    async def mock_fetch_jwks(kid=None):
+        calls.append(kid)
+        return {"kid-1": "public-key-1"}
+
+    monkeypatch.setattr(auth0, "_fetch_jwks", mock_fetch_jwks)
+    monkeypatch.setattr(auth0, "_JWKS_CACHE", {"kid-1": "public-key-1"})
+    monkeypatch.setattr(auth0, "_JWKS_FETCHED_AT", 10**12)
+    monkeypatch.setattr(auth0, "_JWKS_REFETCHED_AT", 0.0)
+
+    assert await auth0._get_cached_jwk(None) is None
+    assert await auth0._get_cached_jwk("made-up-1") is None
+    assert await auth0._get_cached_jwk("made-up-2") is None
+    assert await auth0._get_cached_jwk("kid-1") == "public-key-1"
+    # Only the first unknown kid reached Auth0; no kid never does
+    assert calls == ["made-up-1"]
+
+
+async def test_jwks_background_refresher_warms_cache(monkeypatch):
+    import asyncio
+
+    from app.core import auth0
+
+    fetched = asyncio.Event()
+
+    async def mock_fetch_jwks(kid=None):
+        fetched.set()
+        return {"kid-1": "public-key-1"}
+
+    monkeypatch.setattr(auth0, "_fetch_jwks", mock_fetch_jwks)
+    monkeypatch.setattr(auth0, "_JWKS_CACHE", {})
+    monkeypatch.setattr(auth0, "_JWKS_FETCHED_AT", 0.0)
+    monkeypatch.setattr(auth0, "_JWKS_REFETCHED_AT", 0.0)
+    monkeypatch.setattr(auth0, "_TOKEN_CACHE", {})
+
+    auth0.start_jwks_refresher()
+    await asyncio.wait_for(fetched.wait(), timeout=1)
+    await auth0.stop_jwks_refresher()
+
+    assert auth0._JWKS_CACHE == {"kid-1": "public-key-1"}
+
+
+async def test_verify_auth0_token_rs256(monkeypatch):
+    import json
+    import time
+
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from app.core import auth0
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+
+    async def mock_fetch_jwks(kid=None):
+        return {
+            k.key_id: k.key
+            for k in jwt.PyJWKSet.from_dict({"keys": [{**jwk, "kid": "rsa-1"}]}).keys
+        }
+
+    monkeypatch.setattr(auth0, "_fetch_jwks", mock_fetch_jwks)
+    monkeypatch.setattr(auth0, "_JWKS_CACHE", {})
+    monkeypatch.setattr(auth0, "_JWKS_FETCHED_AT", 0.0)
+    monkeypatch.setattr(auth0, "_JWKS_REFETCHED_AT", 0.0)
+    monkeypatch.setattr(auth0, "_TOKEN_CACHE", {})
+    monkeypatch.setattr(auth0, "_AUTH0_ISSUER", "https://mock.auth0.com/")
+    monkeypatch.setattr(auth0, "_AUTH0_AUDIENCE", "mock-api")
+
+    token = jwt.encode(
+        {
+            "sub": "auth0|rsa",
+            "email": "rsa@example.com",
+            "aud": "mock-api",
+            "iss": "https://mock.auth0.com/",
+            "exp": int(time.time()) + 60,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": "rsa-1"},
+    )
+
+    payload = await auth0.verify_auth0_token(token)
+
+    assert payload["email"] == "rsa@example.com"
+    with pytest.raises(auth0.Auth0Error):
+        await auth0.verify_auth0_token(token[:-4] + "AAAA")
+
+    # Repeat calls are served from the payload cache without touching JWKS
+    async def fail_get_public_key(token: str):
+        raise AssertionError("public key lookup should be skipped")
+
+    monkeypatch.setattr(auth0, "get_auth0_public_key", fail_get_public_key)
+    assert await auth0.verify_auth0_token(token) is payload
+
+
+async def test_jwks_shared_through_redis(monkeypatch):
+    import json
+
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from fakeredis import FakeServer
+    from fakeredis.aioredis import FakeRedis
+
+    from app.core import auth0
+
+    public_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048
+    ).public_key()
+    jwk = {**json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key)), "kid": "k1"}
+
+    calls = []
+
+    async def mock_fetch_from_auth0():
+        calls.append(1)
+        return {"k1": json.dumps(jwk)}
+
+    server = FakeServer()
+    redis = FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(auth0, "_fetch_jwks_from_auth0", mock_fetch_from_auth0)
+    monkeypatch.setattr(auth0, "get_redis", lambda: redis)
+
+    # First worker fetches from Auth0 and shares the keys through Redis
+    assert "k1" in await auth0._fetch_jwks("k1")
+    assert await redis.hkeys("auth0:jwks") == ["k1"]
+    # Another worker is served from Redis
+    assert "k1" in await auth0._fetch_jwks("k1")
+    assert len(calls) == 1
+    # A kid missing from Redis goes to Auth0 again
+    await auth0._fetch_jwks("k2")
+    assert len(calls) == 2
+
+    # Redis outage falls back to Auth0
+    server.connected = False
+    assert "k1" in await auth0._fetch_jwks("k1")
+    assert len(calls) == 3
@@ -18,6 +18,38 @@ async def test_get_notifications_success(
     assert "results" in response.json()
 
 
+async def test_get_notifications_cursor_pages(
+    client: AsyncClient,
+    test_user_token: str,
+    test_notifications,
+):
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+
+    first = (await client.get("/notifications?limit=2", headers=headers)).json()
+    second = (
+        await client.get(
+            f"/notifications?limit=2&cursor={first['next_cursor']}", headers=headers
+        )
+    ).json()
+    first_ids = {n["id"] for n in first["results"]}
+
+    assert first["next_cursor"] is not None
+    assert len(second["results"]) == 2
+    assert first_ids.isdisjoint(n["id"] for n in second["results"])
+
+
+async def test_get_notifications_invalid_cursor(
+    client: AsyncClient,
+    test_user_token: str,
+):
+    response = await client.get(
+        "/notifications?cursor=bm90LWEtY3Vyc29y",
+        headers={"Authorization": f"Bearer {test_user_token}"},
+    )
+
+    assert response.status_code == 400
+
+
 async def test_mark_as_read_success(
     client: AsyncClient,
     test_user_token: str,
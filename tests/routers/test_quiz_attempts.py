@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
@@ -524,6 +526,37 @@ async def test_get_user_statistics_no_attempts(
     assert data["last_attempt_at"] is None
 
 
+async def test_get_user_statistics_refreshed_after_submit(
+    client: AsyncClient,
+    test_user_token: str,
+    test_quiz: Quiz,
+    db_session: AsyncSession,
+):
+    """Cached statistics are invalidated when the user completes an attempt."""
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    await db_session.refresh(test_quiz, ["questions"])
+    payload = {
+        "answers": [
+            {
+                "question_id": q.id,
+                "answer_id": next(a.id for a in q.answers if a.is_correct),
+            }
+            for q in test_quiz.questions
+        ]
+    }
+
+    before = await client.get("/quiz-attempts/users/me/statistics", headers=headers)
+    submit = await client.post(
+        f"/quiz-attempts/quizzes/{test_quiz.id}/attempt", json=payload, headers=headers
+    )
+    after = await client.get("/quiz-attempts/users/me/statistics", headers=headers)
+
+    assert submit.status_code == 201
+    assert before.json()["total_quizzes_taken"] == 0
+    assert after.json()["total_quizzes_taken"] == 1
+    assert after.json()["global_average"] == 100.0
+
+
 # ============================================================================
 # TEST: Get Quiz History
 # ============================================================================
@@ -564,8 +597,8 @@ async def test_get_quiz_history_with_pagination(
             company_id=test_quiz.company_id,
             score=i,
             total_questions=10,
+            completed_at=datetime.now(timezone.utc),
         )
-        attempt.mark_completed()
         db_session.add(attempt)
 
     await db_session.commit()
@@ -625,8 +658,8 @@ async def test_get_quiz_history_with_company_filter(
         company_id=test_company.id,
         score=5,
         total_questions=10,
+        completed_at=datetime.now(timezone.utc),
     )
-    attempt1.mark_completed()
     db_session.add(attempt1)
 
     attempt2 = QuizAttempt(
@@ -635,8 +668,8 @@ async def test_get_quiz_history_with_company_filter(
         company_id=test_hidden_company.id,
         score=7,
         total_questions=10,
+        completed_at=datetime.now(timezone.utc),
     )
-    attempt2.mark_completed()
     db_session.add(attempt2)
 
     await db_session.commit()
@@ -679,8 +712,8 @@ async def test_get_quiz_history_with_quiz_filter(
         company_id=test_quiz.company_id,
         score=5,
         total_questions=10,
+        completed_at=datetime.now(timezone.utc),
     )
-    attempt1.mark_completed()
     db_session.add(attempt1)
 
     attempt2 = QuizAttempt(
@@ -689,8 +722,8 @@ async def test_get_quiz_history_with_quiz_filter(
         company_id=test_quiz.company_id,
         score=7,
         total_questions=10,
+        completed_at=datetime.now(timezone.utc),
     )
-    attempt2.mark_completed()
     db_session.add(attempt2)
 
     await db_session.commit()
@@ -4,7 +4,10 @@ import pytest
 
 from app.core.exceptions import BadRequestException, PermissionDeniedException
 from app.models import QuizAttempt, QuizUserAnswer
-from app.schemas.pagination.pagination import PaginationBaseSchema
+from app.schemas.pagination.pagination import (
+    CursorPaginationSchema,
+    PaginationBaseSchema,
+)
 from app.services.analytics.company_analytics_service import CompanyAnalyticsService
 from app.services.analytics.user_analytics_service import UserAnalyticsService
 from app.services.companies.admin_service import AdminService
@@ -77,7 +80,7 @@ async def test_company_service_permission_denied(
 
     service = CompanyAnalyticsService(uow, admin_service)
 
-    pagination = PaginationBaseSchema(page=1, limit=10)
+    pagination = CursorPaginationSchema(page=1, limit=10)
 
     with pytest.raises(PermissionDeniedException):
         await service.get_users_averages_paginated(
@@ -122,7 +125,7 @@ async def test_user_service_quiz_averages_paginated(
     )
     await db_session.commit()
 
-    pagination = PaginationBaseSchema(page=1, limit=10)
+    pagination = CursorPaginationSchema(page=1, limit=10)
     result = await service.get_quiz_averages_paginated(
         user_id=test_user.id,
         from_date=date(2000, 1, 1),
@@ -176,7 +179,7 @@ async def test_company_service_owner_can_access(
     )
 
     service = CompanyAnalyticsService(uow, admin_service)
-    pagination = PaginationBaseSchema(page=1, limit=10)
+    pagination = CursorPaginationSchema(page=1, limit=10)
 
     result = await service.get_users_averages_paginated(
         company_id=test_company.id,
@@ -206,7 +209,7 @@ async def test_company_service_admin_can_access(
 
     service = CompanyAnalyticsService(uow, admin_service)
 
-    pagination = PaginationBaseSchema(page=1, limit=10)
+    pagination = CursorPaginationSchema(page=1, limit=10)
 
     result = await service.get_users_averages_paginated(
         company_id=company_with_admin.id,
@@ -264,7 +267,7 @@ async def test_user_quiz_averages_invalid_date_range_service(unit_of_work):
     """
     service = UserAnalyticsService(uow=unit_of_work)
 
-    pagination = PaginationBaseSchema(page=1, limit=10)
+    pagination = CursorPaginationSchema(page=1, limit=10)
 
     with pytest.raises(BadRequestException):
         await service.get_quiz_averages_paginated(
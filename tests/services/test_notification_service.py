@@ -1,10 +1,12 @@
 import pytest
+from fakeredis.aioredis import FakeRedis
 
 from app.core.exceptions import NotFoundException
 from app.enums import NotificationStatus
 from app.models import Company, Notification, User
 from app.schemas.notification.notification import NotificationsPaginationRequest
 from app.services.notification.notification_service import NotificationService
+from app.services.notification.unread_count_cache import UnreadCountCache
 
 
 async def test_create_notifications_for_company_members(
@@ -68,3 +70,50 @@ async def test_mark_notification_as_read_not_found(
             notification_id=99999,
             user_id=1,
         )
+
+
+async def test_unread_count_is_cached_and_invalidated_on_read(
+    unit_of_work,
+    test_notifications: list[Notification],
+):
+    cache = UnreadCountCache(FakeRedis(decode_responses=True))
+    notification_service = NotificationService(unit_of_work, unread_cache=cache)
+    notif = test_notifications[0]
+    pagination = NotificationsPaginationRequest(page=1, limit=10)
+
+    await notification_service.get_user_notifications(notif.user_id, pagination)
+    cached = await cache.get(notif.user_id)
+    await notification_service.mark_notification_as_read(notif.id, notif.user_id)
+    after_read = await cache.get(notif.user_id)
+    response = await notification_service.get_user_notifications(
+        notif.user_id, pagination
+    )
+
+    assert cached == 3
+    assert after_read is None
+    assert response.unread_count == 2
+
+
+async def test_unread_count_invalidated_only_after_commit(
+    unit_of_work,
+    test_notifications: list[Notification],
+):
+    cache = UnreadCountCache(FakeRedis(decode_responses=True))
+    notification_service = NotificationService(unit_of_work, unread_cache=cache)
+    user_id = test_notifications[0].user_id
+    pagination = NotificationsPaginationRequest(page=1, limit=10)
+
+    await notification_service.get_user_notifications(user_id, pagination)
+    await notification_service.create_notification(user_id, "New quiz")
+    # Not committed yet: readers keep getting the committed count
+    before_commit = await notification_service.get_user_notifications(
+        user_id, pagination
+    )
+    await unit_of_work.commit()
+    await notification_service.invalidate_unread_counts(user_id)
+    after_commit = await notification_service.get_user_notifications(
+        user_id, pagination
+    )
+
+    assert before_commit.unread_count == 3
+    assert after_commit.unread_count == 4
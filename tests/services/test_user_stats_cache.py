@@ -0,0 +1,32 @@
+from fakeredis.aioredis import FakeRedis
+
+from app.db.quiz.attempt_repository import UserAttemptStats
+from app.services.quiz.user_stats_cache import UserStatsCache
+
+
+async def test_stats_computed_before_invalidation_are_not_served():
+    redis = FakeRedis(decode_responses=True)
+    worker, other_worker = UserStatsCache(redis), UserStatsCache(redis)
+    stale = UserAttemptStats(1, 2, 1, None)
+
+    # Both reads miss and start computing before a submit invalidates
+    _, generation = await worker.get(1)
+    _, other_generation = await other_worker.get(1)
+    await worker.invalidate(1, company_id=5)
+    await worker.set(1, None, stale, generation)
+    await other_worker.set(1, None, stale, other_generation)
+
+    assert await worker.get(1) == (None, 1)
+    assert await UserStatsCache(redis).get(1) == (None, 1)
+
+
+async def test_stats_cached_after_invalidation_are_served():
+    redis = FakeRedis(decode_responses=True)
+    cache = UserStatsCache(redis)
+    fresh = UserAttemptStats(3, 4, 2, None)
+
+    await cache.invalidate(1, company_id=5)
+    _, generation = await cache.get(1, 5)
+    await cache.set(1, 5, fresh, generation)
+
+    assert await UserStatsCache(redis).get(1, 5) == (fresh, 1)
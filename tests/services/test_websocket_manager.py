@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from starlette.websockets import WebSocketState
+
+from app.core.websocket_manager import WebSocketManager
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0, fail: bool = False):
+        self.client_state = WebSocketState.CONNECTED
+        self.delay = delay
+        self.fail = fail
+        self.sent: list = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection lost")
+        self.sent.append(json.loads(data))
+
+
+async def test_send_personal_removes_dead_connections():
+    manager = WebSocketManager()
+    alive, broken, closed = FakeWebSocket(), FakeWebSocket(fail=True), FakeWebSocket()
+    closed.client_state = WebSocketState.DISCONNECTED
+    for ws in (alive, broken, closed):
+        await manager.connect(1, ws)
+
+    sent = await manager.send_personal(1, {"type": "ping"})
+
+    assert sent == 1
+    assert alive.sent == [{"type": "ping"}]
+    assert manager.get_connection_count(1) == 1
+
+
+async def test_broadcast_sends_concurrently():
+    manager = WebSocketManager()
+    sockets = [FakeWebSocket(delay=0.05) for _ in range(10)]
+    for user_id, ws in enumerate(sockets):
+        await manager.connect(user_id, ws)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    sent = await manager.broadcast({"type": "news"})
+    elapsed = loop.time() - started
+
+    assert sent == 10
+    assert all(ws.sent == [{"type": "news"}] for ws in sockets)
+    # Serial sends would take ~0.5s
+    assert elapsed < 0.3
+
+
+async def test_broadcast_encodes_message_once(monkeypatch):
+    from app.core import websocket_manager
+
+    calls = []
+    real_dumps = websocket_manager.orjson.dumps
+
+    def counting_dumps(obj):
+        calls.append(obj)
+        return real_dumps(obj)
+
+    monkeypatch.setattr(websocket_manager.orjson, "dumps", counting_dumps)
+
+    manager = WebSocketManager()
+    for user_id in range(5):
+        await manager.connect(user_id, FakeWebSocket())
+        await manager.connect(user_id, FakeWebSocket())
+
+    assert await manager.broadcast({"type": "news"}) == 10
+    assert len(calls) == 1
@@ -0,0 +1,72 @@
+from app.config import Settings, settings
+
+
+def test_settings_from_trusted_skips_validation():
+    snapshot = settings.to_dict()
+    snapshot["database"]["DATABASE_URL"] = "postgres://trusted/db"
+
+    clone = Settings.from_trusted(snapshot)
+
+    # model_construct does not run build_database_url, so the value is kept as is
+    assert clone.database.DATABASE_URL == "postgres://trusted/db"
+    assert clone.auth.SECRET_KEY == settings.auth.SECRET_KEY
+    assert clone.redis.REDIS_URL == settings.redis.REDIS_URL
+
+
+def test_dataclass_settings_from_env(monkeypatch):
+    import pytest
+
+    from app.config import base
+    from app.config.auth_settings import AuthSettings
+
+    monkeypatch.setattr(base, "_env_file_values", lambda: {})
+    monkeypatch.setenv("SECRET_KEY", "s1")
+    monkeypatch.setenv("REFRESH_SECRET_KEY", "s2")
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+
+    auth = AuthSettings.from_env()
+
+    assert auth.SECRET_KEY == "s1"
+    assert auth.ACCESS_TOKEN_EXPIRE_MINUTES == 5
+    assert auth.ALGORITHM == "HS256"
+
+    monkeypatch.delenv("SECRET_KEY")
+    with pytest.raises(ValueError):
+        AuthSettings.from_env()
+
+
+def test_dataclass_settings_parse_env_strings(monkeypatch):
+    from dataclasses import dataclass
+
+    from app.config import base
+
+    @dataclass(frozen=True, slots=True)
+    class ExampleSettings(base.EnvDataclass):
+        ENABLED: bool = True
+        LIMIT: "int | None" = None
+        RATIO: float = 1.0
+
+    monkeypatch.setattr(base, "_env_file_values", lambda: {})
+    monkeypatch.setenv("ENABLED", "false")
+    monkeypatch.setenv("LIMIT", "7")
+    monkeypatch.setenv("RATIO", "0.5")
+
+    example = ExampleSettings.from_env()
+
+    assert example.ENABLED is False
+    assert example.LIMIT == 7
+    assert example.RATIO == 0.5
+
+    monkeypatch.setenv("LIMIT", "")
+    assert ExampleSettings.from_env().LIMIT is None
+
+
+def test_dataclass_settings_reject_unsupported_types():
+    import pytest
+
+    from app.config.base import EnvDataclass
+
+    with pytest.raises(TypeError):
+
+        class BadSettings(EnvDataclass):
+            ORIGINS: list[str]
@@ -0,0 +1,36 @@
+from app.core import database
+
+
+class FakeConnection:
+    closed = 0
+
+    def __await__(self):
+        yield from ()
+        return self
+
+    async def close(self):
+        FakeConnection.closed += 1
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        if self.connects == 1:
+            raise OSError("connection refused")
+        return FakeConnection()
+
+
+async def test_warm_up_pool_opens_pool_size_connections(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setattr(database, "get_engine", lambda: engine)
+    FakeConnection.closed = 0
+
+    await database.warm_up_pool()
+
+    pool_size = database.settings.database.POOL_SIZE
+    assert engine.connects == pool_size
+    # A failed connection is tolerated; the rest go back to the pool
+    assert FakeConnection.closed == pool_size - 1
@@ -0,0 +1,50 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import (
+    RequestServices,
+    get_company_analytics_service,
+    get_quiz_attempt_service,
+    get_redis_quiz_service,
+    get_uow,
+)
+from app.services import QuizAttemptService
+from app.services.analytics.company_analytics_service import CompanyAnalyticsService
+
+
+def test_uow_is_shared_across_service_graph():
+    calls = []
+
+    def counting_uow():
+        calls.append(1)
+        return object()
+
+    app = FastAPI()
+
+    @app.get("/probe")
+    def probe(
+        attempts: QuizAttemptService = Depends(get_quiz_attempt_service),
+        analytics: CompanyAnalyticsService = Depends(get_company_analytics_service),
+    ):
+        return {"same": attempts._uow is analytics._uow}
+
+    app.dependency_overrides[get_uow] = counting_uow
+    app.dependency_overrides[get_redis_quiz_service] = lambda: None
+
+    response = TestClient(app).get("/probe")
+
+    assert response.status_code == 200
+    assert response.json() == {"same": True}
+    assert len(calls) == 1
+
+
+def test_request_services_build_lazily_and_share_children():
+    services = RequestServices(
+        uow=object(), manager=object(), redis_quiz_service=object()
+    )
+
+    attempts = services.quiz_attempt_service
+
+    assert attempts is services.quiz_attempt_service
+    assert attempts._quiz_service is services.quiz_service
+    assert "company_analytics_service" not in services.__dict__
@@ -0,0 +1,22 @@
+from app.core.exceptions import NotFoundException, UnauthorizedException
+
+
+def test_app_exception_keeps_message_in_args():
+    exc = NotFoundException("Quiz 1 not found")
+
+    assert exc.status_code == 404
+    assert exc.detail == "Quiz 1 not found"
+    assert "Quiz 1 not found" in str(exc)
+    assert "Quiz 1 not found" in repr(exc)
+
+
+def test_app_exception_headers_are_shared_and_read_only():
+    import pytest
+
+    first = UnauthorizedException()
+
+    assert first.detail == "Could not validate credentials"
+    assert first.headers == {"WWW-Authenticate": "Bearer"}
+    assert first.headers is UnauthorizedException().headers
+    with pytest.raises(TypeError):
+        first.headers["X-Extra"] = "1"
@@ -11,3 +11,16 @@ def test_health_check():
     data = response.json()
     assert data["detail"] == "ok"
     assert data["result"] == "working"
+
+
+def test_small_responses_are_not_compressed():
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_large_responses_are_gzipped():
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["info"]["title"]
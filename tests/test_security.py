@@ -0,0 +1,87 @@
+from app.core.security import hash_password, verify_password
+
+# Hash produced by the previous passlib CryptContext(schemes=["bcrypt"])
+LEGACY_HASH = "$2b$04$EHK/1RfNYj94jtlG1lk6c.6ynjkWi9CCPV3YblgWVxwHEzmvQA28S"
+
+
+def test_verify_password_accepts_legacy_passlib_hash():
+    assert verify_password("legacy-password", LEGACY_HASH)
+    assert not verify_password("wrong-password", LEGACY_HASH)
+
+
+def test_hash_password_roundtrip():
+    hashed = hash_password("s3cret")
+
+    assert hashed.startswith("$2b$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("s3cret!", hashed)
+
+
+async def test_async_password_helpers_run_on_bcrypt_pool():
+    from app.core.security import hash_password_async, verify_password_async
+
+    hashed = await hash_password_async("s3cret")
+
+    assert await verify_password_async("s3cret", hashed)
+    assert not await verify_password_async("nope", hashed)
+
+
+def test_decode_access_token_caches_verified_tokens(monkeypatch):
+    from app.core import security
+
+    token = security.create_access_token({"sub": "42"})
+    payload = security.decode_access_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("signature should not be re-verified")
+
+    monkeypatch.setattr(security.jwt_codec, "decode", fail_decode)
+
+    assert security.decode_access_token(token) is payload
+    # Same token presented as a refresh token is not served from the cache
+    assert security.decode_refresh_token(token) is None
+
+
+def test_orjson_codec_interoperates_with_stock_pyjwt():
+    import jwt
+    import pytest
+
+    from app.core.jwt_codec import jwt_codec
+
+    claims = {"sub": "7", "exp": 4102444800, "name": "Юзер"}
+
+    ours = jwt_codec.encode(claims, b"k", algorithm="HS256")
+    stock = jwt.encode(claims, b"k", algorithm="HS256")
+
+    assert jwt.decode(ours, b"k", algorithms=["HS256"]) == claims
+    assert jwt_codec.decode(stock, b"k", algorithms=["HS256"]) == claims
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt_codec.decode(ours, b"other", algorithms=["HS256"])
+
+
+def test_hash_token_uses_keyed_hmac():
+    from app.core.security import hash_token, verify_token
+
+    hashed = hash_token("random-server-secret")
+
+    assert len(hashed) == 64
+    assert verify_token("random-server-secret", hashed)
+    assert not verify_token("other-secret", hashed)
+    # Token hashes are never accepted as password hashes
+    assert not verify_password("random-server-secret", hashed)
+
+
+def test_decode_uses_prepared_key_for_configured_secret():
+    import jwt
+
+    from app.config import settings
+    from app.core import security
+
+    claims = {"sub": "9", "exp": 4102444800}
+    token = jwt.encode(claims, settings.auth.SECRET_KEY, algorithm="HS256")
+    forged = jwt.encode(claims, "not-the-secret", algorithm="HS256")
+
+    assert security.decode_access_token(token) == claims
+    assert security.decode_access_token(forged) is None
+    # Access and refresh tokens are signed with different secrets
+    assert security.decode_refresh_token(token) is None
@@ -0,0 +1,55 @@
+from app.core.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class FakeSession:
+    async def close(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+async def test_repositories_are_lazy_and_bound_to_current_session():
+    uow = SQLAlchemyUnitOfWork()
+    uow.session_factory = FakeSession
+
+    async with uow:
+        users = uow.users
+        assert users is uow.users
+        assert users.session is uow.session
+        assert "companies" not in uow.__dict__
+
+        outer_session = uow.session
+        async with uow:
+            # A nested scope opens a new session; repositories follow it
+            assert uow.users.session is uow.session is not outer_session
+
+    assert "users" not in uow.__dict__
+
+
+async def test_analytics_repositories_use_read_session_when_configured():
+    closed = []
+
+    class ReadSession(FakeSession):
+        async def close(self):
+            closed.append(self)
+
+    uow = SQLAlchemyUnitOfWork()
+    uow.session_factory = FakeSession
+    uow.read_session_factory = ReadSession
+
+    async with uow:
+        assert isinstance(uow.company_analytic.session, ReadSession)
+        assert uow.user_analytic.session is uow.read_session
+        assert uow.users.session is uow.session
+
+    assert len(closed) == 1
+
+
+async def test_read_session_falls_back_to_main_session():
+    uow = SQLAlchemyUnitOfWork()
+    uow.session_factory = FakeSession
+    uow.read_session_factory = None
+
+    async with uow:
+        assert uow.company_analytic.session is uow.session